@@ -0,0 +1,69 @@
+"""full-text-search
+
+Revision ID: 20261017_0001
+Revises: 20260131_0002
+Create Date: 2026-10-17 09:12:41.503118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0001"
+down_revision = "20260131_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.add_column(
+        "projects",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_projects_search_vector",
+        "projects",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+        ),
+    )
+    op.create_index(
+        "ix_tasks_search_vector",
+        "tasks",
+        ["search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_search_vector", table_name="tasks")
+    op.drop_column("tasks", "search_vector")
+
+    op.drop_index("ix_projects_search_vector", table_name="projects")
+    op.drop_column("projects", "search_vector")
@@ -0,0 +1,40 @@
+"""trigram-name-indexes
+
+Revision ID: 20261017_0002
+Revises: 20261017_0001
+Create Date: 2026-10-17 10:03:18.271940
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0002"
+down_revision = "20261017_0001"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        "ix_projects_name_trgm",
+        "projects",
+        ["name"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"name": "gin_trgm_ops"},
+    )
+    op.create_index(
+        "ix_tasks_title_trgm",
+        "tasks",
+        ["title"],
+        unique=False,
+        postgresql_using="gin",
+        postgresql_ops={"title": "gin_trgm_ops"},
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_title_trgm", table_name="tasks")
+    op.drop_index("ix_projects_name_trgm", table_name="projects")
@@ -0,0 +1,119 @@
+"""list-query-indexes
+
+Revision ID: 20261017_0003
+Revises: 20261017_0002
+Create Date: 2026-10-17 11:21:05.894412
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0003"
+down_revision = "20261017_0002"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # Primary keys are already indexed; the extra ix_*_id indexes only cost writes.
+    op.drop_index(op.f("ix_users_id"), table_name="users")
+    op.drop_index(op.f("ix_projects_id"), table_name="projects")
+    op.drop_index(op.f("ix_tasks_id"), table_name="tasks")
+
+    # Superseded by the composite indexes below, which share the same prefix.
+    op.drop_index(op.f("ix_projects_owner_id"), table_name="projects")
+    op.drop_index(op.f("ix_tasks_project_id"), table_name="tasks")
+
+    op.create_index(
+        "ix_projects_owner_id_created_at",
+        "projects",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_owner_id_updated_at",
+        "projects",
+        ["owner_id", "updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_owner_id_name",
+        "projects",
+        ["owner_id", "name", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_owner_id_status_created_at",
+        "projects",
+        ["owner_id", "status", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_projects_active_owner_id_created_at",
+        "projects",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text("status = 'active'"),
+    )
+
+    op.create_index(
+        "ix_tasks_project_id_created_at",
+        "tasks",
+        ["project_id", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_updated_at",
+        "tasks",
+        ["project_id", "updated_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_title",
+        "tasks",
+        ["project_id", "title", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_priority",
+        "tasks",
+        ["project_id", "priority", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_status_created_at",
+        "tasks",
+        ["project_id", "status", "created_at", "id"],
+        unique=False,
+    )
+    op.create_index(
+        "ix_tasks_project_id_due_date",
+        "tasks",
+        ["project_id", "due_date", "id"],
+        unique=False,
+        postgresql_where=sa.text("due_date IS NOT NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_project_id_due_date", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_status_created_at", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_priority", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_title", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_updated_at", table_name="tasks")
+    op.drop_index("ix_tasks_project_id_created_at", table_name="tasks")
+
+    op.drop_index("ix_projects_active_owner_id_created_at", table_name="projects")
+    op.drop_index("ix_projects_owner_id_status_created_at", table_name="projects")
+    op.drop_index("ix_projects_owner_id_name", table_name="projects")
+    op.drop_index("ix_projects_owner_id_updated_at", table_name="projects")
+    op.drop_index("ix_projects_owner_id_created_at", table_name="projects")
+
+    op.create_index(op.f("ix_tasks_project_id"), "tasks", ["project_id"], unique=False)
+    op.create_index(op.f("ix_projects_owner_id"), "projects", ["owner_id"], unique=False)
+
+    op.create_index(op.f("ix_tasks_id"), "tasks", ["id"], unique=False)
+    op.create_index(op.f("ix_projects_id"), "projects", ["id"], unique=False)
+    op.create_index(op.f("ix_users_id"), "users", ["id"], unique=False)
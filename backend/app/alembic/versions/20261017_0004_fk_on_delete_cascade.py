@@ -0,0 +1,49 @@
+"""fk-on-delete-cascade
+
+Revision ID: 20261017_0004
+Revises: 20261017_0003
+Create Date: 2026-10-17 14:26:09.381754
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0004"
+down_revision = "20261017_0003"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.drop_constraint("tasks_project_id_fkey", "tasks", type_="foreignkey")
+    op.create_foreign_key(
+        "tasks_project_id_fkey",
+        "tasks",
+        "projects",
+        ["project_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+    op.drop_constraint("projects_owner_id_fkey", "projects", type_="foreignkey")
+    op.create_foreign_key(
+        "projects_owner_id_fkey",
+        "projects",
+        "users",
+        ["owner_id"],
+        ["id"],
+        ondelete="CASCADE",
+    )
+
+
+def downgrade():
+    op.drop_constraint("projects_owner_id_fkey", "projects", type_="foreignkey")
+    op.create_foreign_key(
+        "projects_owner_id_fkey", "projects", "users", ["owner_id"], ["id"]
+    )
+
+    op.drop_constraint("tasks_project_id_fkey", "tasks", type_="foreignkey")
+    op.create_foreign_key(
+        "tasks_project_id_fkey", "tasks", "projects", ["project_id"], ["id"]
+    )
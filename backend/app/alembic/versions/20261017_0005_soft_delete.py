@@ -0,0 +1,91 @@
+"""soft-delete
+
+Revision ID: 20261017_0005
+Revises: 20261017_0004
+Create Date: 2026-10-17 15:02:37.118290
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0005"
+down_revision = "20261017_0004"
+branch_labels = None
+depends_on = None
+
+# List indexes rebuilt as partial indexes over live rows. The `*_created_at`
+# indexes stay complete because the ON DELETE CASCADE lookups rely on them.
+PROJECT_INDEXES = {
+    "ix_projects_owner_id_updated_at": (["owner_id", "updated_at", "id"], None),
+    "ix_projects_owner_id_name": (["owner_id", "name", "id"], None),
+    "ix_projects_owner_id_status_created_at": (
+        ["owner_id", "status", "created_at", "id"],
+        None,
+    ),
+    "ix_projects_active_owner_id_created_at": (
+        ["owner_id", "created_at", "id"],
+        "status = 'active'",
+    ),
+}
+TASK_INDEXES = {
+    "ix_tasks_project_id_updated_at": (["project_id", "updated_at", "id"], None),
+    "ix_tasks_project_id_title": (["project_id", "title", "id"], None),
+    "ix_tasks_project_id_priority": (["project_id", "priority", "id"], None),
+    "ix_tasks_project_id_status_created_at": (
+        ["project_id", "status", "created_at", "id"],
+        None,
+    ),
+    "ix_tasks_project_id_due_date": (
+        ["project_id", "due_date", "id"],
+        "due_date IS NOT NULL",
+    ),
+}
+
+
+def _recreate_indexes(
+    table_name: str,
+    indexes: dict[str, tuple[list[str], str | None]],
+    *,
+    live_only: bool,
+) -> None:
+    for name, (columns, where) in indexes.items():
+        if live_only:
+            where = " AND ".join(filter(None, [where, "deleted_at IS NULL"]))
+        op.drop_index(name, table_name=table_name)
+        op.create_index(
+            name,
+            table_name,
+            columns,
+            unique=False,
+            postgresql_where=sa.text(where) if where else None,
+        )
+
+
+def upgrade():
+    for table_name, indexes in (
+        ("projects", PROJECT_INDEXES),
+        ("tasks", TASK_INDEXES),
+    ):
+        op.add_column(table_name, sa.Column("deleted_at", sa.DateTime(), nullable=True))
+        op.create_index(
+            f"ix_{table_name}_deleted_at",
+            table_name,
+            ["deleted_at"],
+            unique=False,
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        )
+        _recreate_indexes(table_name, indexes, live_only=True)
+
+
+def downgrade():
+    for table_name, indexes in (
+        ("tasks", TASK_INDEXES),
+        ("projects", PROJECT_INDEXES),
+    ):
+        # Soft-deleted rows would become visible again once the column is gone
+        op.execute(f"DELETE FROM {table_name} WHERE deleted_at IS NOT NULL")
+        _recreate_indexes(table_name, indexes, live_only=False)
+        op.drop_index(f"ix_{table_name}_deleted_at", table_name=table_name)
+        op.drop_column(table_name, "deleted_at")
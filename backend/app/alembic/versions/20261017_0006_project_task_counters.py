@@ -0,0 +1,111 @@
+"""project-task-counters
+
+Revision ID: 20261017_0006
+Revises: 20261017_0005
+Create Date: 2026-10-17 16:40:52.207415
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0006"
+down_revision = "20261017_0005"
+branch_labels = None
+depends_on = None
+
+COUNTERS = [
+    "task_count",
+    "todo_task_count",
+    "in_progress_task_count",
+    "done_task_count",
+]
+
+# Adds the per-project sums of `changes(project_id, status, delta)` to the
+# counters. Projects whose counters do not change (e.g. a title edit) are skipped.
+APPLY_CHANGES = """
+    UPDATE projects AS p
+    SET task_count = p.task_count + d.total,
+        todo_task_count = p.todo_task_count + d.todo,
+        in_progress_task_count = p.in_progress_task_count + d.in_progress,
+        done_task_count = p.done_task_count + d.done
+    FROM (
+        SELECT
+            project_id,
+            sum(delta) AS total,
+            coalesce(sum(delta) FILTER (WHERE status = 'todo'), 0) AS todo,
+            coalesce(sum(delta) FILTER (WHERE status = 'in_progress'), 0) AS in_progress,
+            coalesce(sum(delta) FILTER (WHERE status = 'done'), 0) AS done
+        FROM ({changes}) AS changes
+        GROUP BY project_id
+    ) AS d
+    WHERE p.id = d.project_id
+        AND (d.total, d.todo, d.in_progress, d.done) <> (0, 0, 0, 0);
+"""
+
+# Soft-deleted tasks are not counted, so setting or clearing `deleted_at`
+# moves a task out of or back into its project's counters.
+ADDED = "SELECT project_id, status, 1 AS delta FROM new_rows WHERE deleted_at IS NULL"
+REMOVED = (
+    "SELECT project_id, status, -1 AS delta FROM old_rows WHERE deleted_at IS NULL"
+)
+
+# Statement-level triggers see all rows touched by a statement through the
+# transition tables, so a bulk insert of 500 tasks updates each affected
+# project row once instead of 500 times.
+FUNCTION = f"""
+CREATE FUNCTION update_project_task_counters() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {APPLY_CHANGES.format(changes=ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {APPLY_CHANGES.format(changes=REMOVED)}
+    ELSE
+        {APPLY_CHANGES.format(changes=f"{ADDED} UNION ALL {REMOVED}")}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+TRIGGERS = {
+    "tasks_counters_insert": "AFTER INSERT ON tasks REFERENCING NEW TABLE AS new_rows",
+    "tasks_counters_update": (
+        "AFTER UPDATE ON tasks REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+    ),
+    "tasks_counters_delete": "AFTER DELETE ON tasks REFERENCING OLD TABLE AS old_rows",
+}
+
+
+def upgrade():
+    for column in COUNTERS:
+        op.add_column(
+            "projects",
+            sa.Column(column, sa.Integer(), server_default="0", nullable=False),
+        )
+
+    op.execute(FUNCTION)
+    for name, definition in TRIGGERS.items():
+        op.execute(
+            f"CREATE TRIGGER {name} {definition} "
+            "FOR EACH STATEMENT EXECUTE FUNCTION update_project_task_counters()"
+        )
+
+    # Backfill from the existing tasks
+    op.execute(
+        APPLY_CHANGES.format(
+            changes="SELECT project_id, status, 1 AS delta FROM tasks "
+            "WHERE deleted_at IS NULL"
+        )
+    )
+
+
+def downgrade():
+    for name in TRIGGERS:
+        op.execute(f"DROP TRIGGER {name} ON tasks")
+    op.execute("DROP FUNCTION update_project_task_counters()")
+
+    for column in reversed(COUNTERS):
+        op.drop_column("projects", column)
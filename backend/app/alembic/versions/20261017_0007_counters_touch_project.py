@@ -0,0 +1,74 @@
+"""counters-touch-project
+
+Revision ID: 20261017_0007
+Revises: 20261017_0006
+Create Date: 2026-10-17 18:05:12.481930
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0007"
+down_revision = "20261017_0006"
+branch_labels = None
+depends_on = None
+
+# Same as in 20261017_0006, optionally also bumping `updated_at`: the counters
+# are part of the project's representation, so `id` + `updated_at` can serve
+# as its ETag / Last-Modified validators.
+APPLY_CHANGES = """
+    UPDATE projects AS p
+    SET task_count = p.task_count + d.total,
+        todo_task_count = p.todo_task_count + d.todo,
+        in_progress_task_count = p.in_progress_task_count + d.in_progress,
+        done_task_count = p.done_task_count + d.done{touch}
+    FROM (
+        SELECT
+            project_id,
+            sum(delta) AS total,
+            coalesce(sum(delta) FILTER (WHERE status = 'todo'), 0) AS todo,
+            coalesce(sum(delta) FILTER (WHERE status = 'in_progress'), 0) AS in_progress,
+            coalesce(sum(delta) FILTER (WHERE status = 'done'), 0) AS done
+        FROM ({changes}) AS changes
+        GROUP BY project_id
+    ) AS d
+    WHERE p.id = d.project_id
+        AND (d.total, d.todo, d.in_progress, d.done) <> (0, 0, 0, 0);
+"""
+
+TOUCH = ",\n        updated_at = timezone('UTC', clock_timestamp())"
+
+ADDED = "SELECT project_id, status, 1 AS delta FROM new_rows WHERE deleted_at IS NULL"
+REMOVED = (
+    "SELECT project_id, status, -1 AS delta FROM old_rows WHERE deleted_at IS NULL"
+)
+
+
+def _function(touch: str) -> str:
+    def apply(changes: str) -> str:
+        return APPLY_CHANGES.format(changes=changes, touch=touch)
+
+    return f"""
+CREATE OR REPLACE FUNCTION update_project_task_counters() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {apply(ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {apply(REMOVED)}
+    ELSE
+        {apply(f"{ADDED} UNION ALL {REMOVED}")}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade():
+    op.execute(_function(TOUCH))
+
+
+def downgrade():
+    op.execute(_function(""))
@@ -0,0 +1,101 @@
+"""collection-versions
+
+Revision ID: 20261017_0008
+Revises: 20261017_0007
+Create Date: 2026-10-17 19:22:40.913274
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0008"
+down_revision = "20261017_0007"
+branch_labels = None
+depends_on = None
+
+# Bumps the version of every collection `{keys}` names, once per statement.
+# Keys are distinct (ON CONFLICT may not touch a row twice) and sorted, so
+# concurrent statements lock the version rows in the same order.
+BUMP = """
+    INSERT INTO collection_versions AS v (scope, key, version, updated_at)
+    SELECT '{scope}', key, 1, timezone('UTC', clock_timestamp())
+    FROM ({keys}) AS changed
+    WHERE key IS NOT NULL
+    ORDER BY key
+    ON CONFLICT (scope, key) DO UPDATE
+    SET version = v.version + 1, updated_at = EXCLUDED.updated_at;
+"""
+
+# scope -> (table, column naming the collection a row belongs to)
+SCOPES = {
+    "projects": ("projects", "owner_id"),
+    "tasks": ("tasks", "project_id"),
+}
+
+
+def _function(scope: str, column: str) -> str:
+    added = f"SELECT DISTINCT {column} AS key FROM new_rows"
+    removed = f"SELECT DISTINCT {column} AS key FROM old_rows"
+    # A row moved to another collection (e.g. a task to another project)
+    # changes both
+    moved = f"SELECT {column} AS key FROM new_rows UNION SELECT {column} FROM old_rows"
+    return f"""
+CREATE FUNCTION bump_{scope}_collection_versions() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {BUMP.format(scope=scope, keys=added)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {BUMP.format(scope=scope, keys=removed)}
+    ELSE
+        {BUMP.format(scope=scope, keys=moved)}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def _triggers(table: str) -> dict[str, str]:
+    return {
+        f"{table}_versions_insert": (
+            f"AFTER INSERT ON {table} REFERENCING NEW TABLE AS new_rows"
+        ),
+        f"{table}_versions_update": (
+            f"AFTER UPDATE ON {table} "
+            "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows"
+        ),
+        f"{table}_versions_delete": (
+            f"AFTER DELETE ON {table} REFERENCING OLD TABLE AS old_rows"
+        ),
+    }
+
+
+def upgrade():
+    op.create_table(
+        "collection_versions",
+        sa.Column("scope", sa.String(), nullable=False),
+        sa.Column("key", sa.Uuid(), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.PrimaryKeyConstraint("scope", "key"),
+    )
+
+    for scope, (table, column) in SCOPES.items():
+        op.execute(_function(scope, column))
+        for name, definition in _triggers(table).items():
+            op.execute(
+                f"CREATE TRIGGER {name} {definition} "
+                f"FOR EACH STATEMENT EXECUTE FUNCTION bump_{scope}_collection_versions()"
+            )
+
+
+def downgrade():
+    for scope, (table, _) in SCOPES.items():
+        for name in _triggers(table):
+            op.execute(f"DROP TRIGGER {name} ON {table}")
+        op.execute(f"DROP FUNCTION bump_{scope}_collection_versions()")
+
+    op.drop_table("collection_versions")
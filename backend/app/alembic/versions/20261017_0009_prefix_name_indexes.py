@@ -0,0 +1,40 @@
+"""prefix-name-indexes
+
+Revision ID: 20261017_0009
+Revises: 20261017_0008
+Create Date: 2026-10-17 20:14:37.602118
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0009"
+down_revision = "20261017_0008"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    # pg_trgm cannot serve typeahead input shorter than three characters, so
+    # `suggest` matches those as prefixes of the lowercased name / title
+    op.create_index(
+        "ix_projects_owner_id_lower_name",
+        "projects",
+        ["owner_id", sa.text("lower(name) text_pattern_ops")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+    op.create_index(
+        "ix_tasks_project_id_lower_title",
+        "tasks",
+        ["project_id", sa.text("lower(title) text_pattern_ops")],
+        unique=False,
+        postgresql_where=sa.text("deleted_at IS NULL"),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_project_id_lower_title", table_name="tasks")
+    op.drop_index("ix_projects_owner_id_lower_name", table_name="projects")
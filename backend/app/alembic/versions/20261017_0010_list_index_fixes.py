@@ -0,0 +1,71 @@
+"""list-index-fixes
+
+Revision ID: 20261017_0010
+Revises: 20261017_0009
+Create Date: 2026-10-17 20:41:09.337815
+
+"""
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0010"
+down_revision = "20261017_0009"
+branch_labels = None
+depends_on = None
+
+LIVE = "deleted_at IS NULL"
+
+
+def upgrade():
+    # The list query orders by (due_date, id) without `due_date IS NOT NULL`,
+    # so it could never use the partial index
+    op.drop_index("ix_tasks_project_id_due_date", table_name="tasks")
+    op.create_index(
+        "ix_tasks_project_id_due_date",
+        "tasks",
+        ["project_id", "due_date", "id"],
+        unique=False,
+        postgresql_where=sa.text(LIVE),
+    )
+    # Duplicates ix_projects_owner_id_status_created_at and cannot match a
+    # `status = :status` bind parameter in a generic plan
+    op.drop_index("ix_projects_active_owner_id_created_at", table_name="projects")
+
+    # sort_by=status
+    op.create_index(
+        "ix_projects_owner_id_status",
+        "projects",
+        ["owner_id", "status", "id"],
+        unique=False,
+        postgresql_where=sa.text(LIVE),
+    )
+    op.create_index(
+        "ix_tasks_project_id_status",
+        "tasks",
+        ["project_id", "status", "id"],
+        unique=False,
+        postgresql_where=sa.text(LIVE),
+    )
+
+
+def downgrade():
+    op.drop_index("ix_tasks_project_id_status", table_name="tasks")
+    op.drop_index("ix_projects_owner_id_status", table_name="projects")
+
+    op.create_index(
+        "ix_projects_active_owner_id_created_at",
+        "projects",
+        ["owner_id", "created_at", "id"],
+        unique=False,
+        postgresql_where=sa.text(f"status = 'active' AND {LIVE}"),
+    )
+    op.drop_index("ix_tasks_project_id_due_date", table_name="tasks")
+    op.create_index(
+        "ix_tasks_project_id_due_date",
+        "tasks",
+        ["project_id", "due_date", "id"],
+        unique=False,
+        postgresql_where=sa.text(f"due_date IS NOT NULL AND {LIVE}"),
+    )
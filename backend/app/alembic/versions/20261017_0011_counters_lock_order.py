@@ -0,0 +1,90 @@
+"""counters-lock-order
+
+Revision ID: 20261017_0011
+Revises: 20261017_0010
+Create Date: 2026-10-17 21:32:47.905126
+
+"""
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20261017_0011"
+down_revision = "20261017_0010"
+branch_labels = None
+depends_on = None
+
+# Per-project sums of `changes(project_id, status, delta)`, as in 20261017_0007
+DELTAS = """
+        SELECT
+            project_id,
+            sum(delta) AS total,
+            coalesce(sum(delta) FILTER (WHERE status = 'todo'), 0) AS todo,
+            coalesce(sum(delta) FILTER (WHERE status = 'in_progress'), 0) AS in_progress,
+            coalesce(sum(delta) FILTER (WHERE status = 'done'), 0) AS done
+        FROM ({changes}) AS changes
+        GROUP BY project_id
+"""
+
+CHANGED = "(d.total, d.todo, d.in_progress, d.done) <> (0, 0, 0, 0)"
+
+# The UPDATE locks project rows in join order, so two statements touching the
+# same projects could lock them in opposite orders and deadlock. Locking them
+# up front by id, like the sorted keys in 20261017_0008, keeps the order the
+# same across transactions.
+LOCK = """
+    PERFORM 1 FROM projects
+    WHERE id IN (SELECT d.project_id FROM ({deltas}) AS d WHERE {changed})
+    ORDER BY id
+    FOR UPDATE;
+"""
+
+APPLY_CHANGES = """
+    UPDATE projects AS p
+    SET task_count = p.task_count + d.total,
+        todo_task_count = p.todo_task_count + d.todo,
+        in_progress_task_count = p.in_progress_task_count + d.in_progress,
+        done_task_count = p.done_task_count + d.done,
+        updated_at = timezone('UTC', clock_timestamp())
+    FROM ({deltas}) AS d
+    WHERE p.id = d.project_id
+        AND {changed};
+"""
+
+ADDED = "SELECT project_id, status, 1 AS delta FROM new_rows WHERE deleted_at IS NULL"
+REMOVED = (
+    "SELECT project_id, status, -1 AS delta FROM old_rows WHERE deleted_at IS NULL"
+)
+
+
+def _function(lock: bool) -> str:
+    def apply(changes: str) -> str:
+        deltas = DELTAS.format(changes=changes)
+        statement = APPLY_CHANGES.format(deltas=deltas, changed=CHANGED)
+        if lock:
+            statement = LOCK.format(deltas=deltas, changed=CHANGED) + statement
+        return statement
+
+    return f"""
+CREATE OR REPLACE FUNCTION update_project_task_counters() RETURNS trigger
+LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP = 'INSERT' THEN
+        {apply(ADDED)}
+    ELSIF TG_OP = 'DELETE' THEN
+        {apply(REMOVED)}
+    ELSE
+        {apply(f"{ADDED} UNION ALL {REMOVED}")}
+    END IF;
+    RETURN NULL;
+END;
+$$;
+"""
+
+
+def upgrade():
+    op.execute(_function(lock=True))
+
+
+def downgrade():
+    op.execute(_function(lock=False))
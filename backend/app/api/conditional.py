@@ -0,0 +1,119 @@
+"""Conditional GETs: `ETag` / `Last-Modified` validators and 304 responses."""
+
+import hashlib
+import uuid
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, NamedTuple
+
+from fastapi import Request, Response, status
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.responses import serialize_as
+from app.crud.collection_version import CollectionScope, get_collection_version
+
+# Clients may keep responses but have to revalidate them before each use, and
+# shared caches must not store them, as they depend on the caller
+CACHE_CONTROL = "private, no-cache"
+
+NOT_MODIFIED_RESPONSE: dict[int | str, dict[str, Any]] = {
+    status.HTTP_304_NOT_MODIFIED: {
+        "description": "Not modified since the version named in "
+        "`If-None-Match` / `If-Modified-Since`"
+    }
+}
+
+
+class Validators(NamedTuple):
+    etag: str
+    last_modified: datetime | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        """Headers sent with both the full response and a 304."""
+        headers = {"ETag": self.etag, "Cache-Control": CACHE_CONTROL}
+        if self.last_modified is not None:
+            headers["Last-Modified"] = format_datetime(
+                _as_utc(self.last_modified), usegmt=True
+            )
+        return headers
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak `ETag` naming the version described by `parts`, e.g. id and timestamp."""
+    version = "|".join(str(part) for part in parts).encode()
+    return f'W/"{hashlib.blake2b(version, digest_size=12).hexdigest()}"'
+
+
+def is_not_modified(request: Request, validators: Validators) -> bool:
+    """
+    Whether the client's cached copy is current (RFC 9110, section 13.2.2).
+
+    `If-None-Match` is compared weakly and, when present, `If-Modified-Since`
+    is ignored. HTTP dates have whole seconds, so `last_modified` is truncated
+    before comparing.
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        if if_none_match.strip() == "*":
+            return True
+        opaque = validators.etag.removeprefix("W/")
+        return any(
+            tag.strip().removeprefix("W/") == opaque for tag in if_none_match.split(",")
+        )
+
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since is None or validators.last_modified is None:
+        return False
+    try:
+        since = parsedate_to_datetime(if_modified_since)
+    except (TypeError, ValueError):
+        return False  # invalid dates are ignored
+    if since.tzinfo is None:
+        return False
+    return _as_utc(validators.last_modified).replace(microsecond=0) <= since
+
+
+def not_modified(validators: Validators) -> Response:
+    """Empty 304 response carrying the current validators."""
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED, headers=validators.headers
+    )
+
+
+def conditional_response(request: Request, schema: Any, obj: Any) -> Response:
+    """
+    `obj` serialized as `schema`, or a 304 if the client already has it.
+
+    The validators come from `obj.id` and `obj.updated_at`, which the database
+    bumps on every update, so the check runs before anything is serialized.
+    """
+    validators = Validators(weak_etag(obj.id, obj.updated_at), obj.updated_at)
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+    return serialize_as(schema, obj, headers=validators.headers)
+
+
+async def get_collection_validators(
+    request: Request, db: AsyncSession, *, scope: CollectionScope, key: uuid.UUID
+) -> Validators:
+    """
+    Validators of a list over the `scope` collection `key`, see
+    `get_collection_version`.
+
+    The `ETag` also covers the query string, as filters, sorting, paging and
+    `fields` all change the response.
+    """
+    version = await get_collection_version(db, scope=scope, key=key)
+    if version is None:
+        return Validators(weak_etag(scope, key, 0, request.url.query))
+    return Validators(
+        weak_etag(scope, key, *version, request.url.query), version.updated_at
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # Timestamps are stored as UTC without time zone, see `Base`
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
@@ -1,12 +1,20 @@
+import math
 from collections.abc import AsyncGenerator, Callable, Coroutine, Iterable
 from typing import Annotated, Any
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, HTTPException, Request, Response, status
 from fastapi_plugin import Auth0FastAPI  # type: ignore[import-untyped]
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.core.config import settings
-from app.core.db import async_session
+from app.core.db import (
+    PrimaryPins,
+    async_session,
+    has_writes,
+    primary_pins,
+    read_session,
+    replica_session,
+)
 from app.crud.user import user as crud_user
 from app.models.user import User
 from app.schemas.user import UserCreate
@@ -15,14 +23,66 @@ from app.scripts.demo.demo_data import seed_demo_data
 _CurrentUserDep = Callable[..., Coroutine[Any, Any, User]]
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    async with async_session.begin() as session:
+SAFE_METHODS = frozenset({"GET", "HEAD", "OPTIONS"})
+
+
+async def get_db(
+    request: Request, response: Response
+) -> AsyncGenerator[AsyncSession, None]:
+    """Session on the primary, committed at the end of the request if it wrote.
+
+    No connection is checked out until the first query, so requests rejected
+    before touching the database never hold a pool slot. Sessions that only
+    read are closed without a COMMIT.
+
+    With a read replica, other requests also pin the client to the primary
+    for its next reads, see `get_read_db`.
+    """
+    if replica_session is not None and request.method not in SAFE_METHODS:
+        # Set before the yield: the code after it, and so the commit, runs once
+        # the response is built and these headers are merged into it, but
+        # before it is sent. A route returning a `Response` itself drops them.
+        response.set_cookie(
+            PrimaryPins.COOKIE,
+            primary_pins.pin(),
+            max_age=math.ceil(primary_pins.seconds),
+            path=settings.API_V1_STR,
+            secure=settings.ENVIRONMENT != "local",
+            httponly=True,
+            samesite="lax",
+        )
+    async with async_session() as session:
+        session.info["safe_method"] = request.method in SAFE_METHODS
         yield session
+        if has_writes(session):
+            await session.commit()
 
 
 DBDep = Annotated[AsyncSession, Depends(get_db)]
 
 
+async def get_read_db(request: Request) -> AsyncGenerator[AsyncSession, None]:
+    """Read-only session for GET endpoints.
+
+    Transactions start as READ ONLY, autoflush is off and the session is closed,
+    rolling back, instead of committed. Served by the replica if one is
+    configured, except when the caller wrote something in the last
+    `POSTGRES_REPLICA_READ_YOUR_WRITES_SECONDS`, as told by the cookie
+    `get_db` set, and the replica might not have caught up yet.
+    """
+    sessionmaker = read_session
+    if replica_session is not None and not primary_pins.is_pinned(
+        request.cookies.get(PrimaryPins.COOKIE)
+    ):
+        sessionmaker = replica_session
+
+    async with sessionmaker() as session:
+        yield session
+
+
+ReadDBDep = Annotated[AsyncSession, Depends(get_read_db)]
+
+
 auth0 = Auth0FastAPI(
     domain=settings.AUTH0_DOMAIN,
     audience=settings.AUTH0_AUDIENCE,
@@ -43,6 +103,7 @@ async def _get_or_create_user(
     session: AsyncSession,
     claims: dict[str, Any],
     profile_data: dict[str, Any] | None = None,
+    read_session: AsyncSession | None = None,
 ) -> User:
     """Get existing user or create new one with optional profile data from frontend.
 
@@ -50,6 +111,8 @@ async def _get_or_create_user(
         session: Database session
         claims: Auth0 JWT claims
         profile_data: Optional profile data from frontend (email, name) for user creation
+        read_session: Optional session to look the user up on; `session` is then
+            only used to create a new user
     """
     auth0_sub: str | None = claims.get("sub")
     if not auth0_sub:
@@ -58,7 +121,9 @@ async def _get_or_create_user(
             detail="Invalid authentication payload",
         )
 
-    user = await crud_user.get_by_auth0_sub(session, auth0_sub=auth0_sub)
+    user = await crud_user.get_by_auth0_sub(
+        read_session or session, auth0_sub=auth0_sub
+    )
     if user:
         return user
 
@@ -80,9 +145,12 @@ async def _get_or_create_user(
         email=email,
         name=name,
     )
-    new_user = await crud_user.create(session, obj_in=user_in)
-    await seed_demo_data(session, owner_id=new_user.id)
-    return new_user
+    # Concurrent first requests of a new user may all get here; only the one
+    # whose insert wins seeds the demo data
+    user, created = await crud_user.get_or_create_by_auth0_sub(session, obj_in=user_in)
+    if created:
+        await seed_demo_data(session, owner_id=user.id)
+    return user
 
 
 def current_user(
@@ -94,8 +162,17 @@ def current_user(
     async def _current_user(
         session: DBDep,
         claims: dict[str, Any] = Depends(auth0.require_auth()),  # type: ignore[assignment]
+        read_session: Annotated[AsyncSession | None, Depends(get_read_db)] = None,
     ) -> User:
-        user = await _get_or_create_user(session, claims, profile_data)
+        safe_method = bool(session.info.get("safe_method"))
+        # GET handlers read through `ReadDBDep`; looking the user up on that
+        # same session leaves the primary untouched unless the user is new
+        user = await _get_or_create_user(
+            session,
+            claims,
+            profile_data,
+            read_session=read_session if safe_method else None,
+        )
 
         if not user.is_active:
             raise HTTPException(
@@ -111,6 +188,11 @@ def current_user(
                 detail="Not enough permissions",
             )
 
+        if safe_method and has_writes(session):
+            # Commit a just-created user and hand the connection back instead
+            # of holding it until the request ends
+            await session.commit()
+
         return user
 
     return _current_user
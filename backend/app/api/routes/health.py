@@ -1,7 +1,8 @@
 from fastapi import APIRouter, HTTPException, status
 from sqlalchemy import text
 
-from app.api.deps import DBDep
+from app.api.deps import CurrentSuperuser, DBDep
+from app.core.db import engine, get_pool_stats, replica_engine
 
 router = APIRouter(tags=["Health"])
 
@@ -31,3 +32,15 @@ async def readiness_check(db: DBDep):
             status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
             detail=f"Service not ready: database connection failed - {str(e)}",
         ) from e
+
+
+@router.get("/pool-stats")
+async def pool_stats(_: CurrentSuperuser):
+    """
+    Connection pool statistics of the worker process serving the request.
+    Reports checked-out and waiting connections and how long checkouts waited.
+    """
+    return {
+        "primary": get_pool_stats(engine),
+        "replica": get_pool_stats(replica_engine) if replica_engine else None,
+    }
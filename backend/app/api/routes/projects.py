@@ -1,25 +1,46 @@
 import uuid
-from typing import Literal
+from collections.abc import Sequence
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, HTTPException, status
-from sqlalchemy import delete
-from sqlmodel import col
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import Row
 
-from app.api.deps import CurrentSuperuser, CurrentUser, DBDep
+from app.api.conditional import (
+    NOT_MODIFIED_RESPONSE,
+    conditional_response,
+    get_collection_validators,
+    is_not_modified,
+    not_modified,
+)
+from app.api.deps import CurrentSuperuser, CurrentUser, DBDep, ReadDBDep
+from app.api.sparse import sparse_fields, sparse_list_response
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.crud.base import CountStrategy
 from app.crud.project import project as crud_project
 from app.models.project import Project
-from app.models.task import Task
 from app.schemas.project import (
     ProjectCreate,
     ProjectListResponse,
     ProjectRead,
+    ProjectSuggestion,
     ProjectUpdate,
 )
 
 router = APIRouter(prefix="/projects", tags=["projects"])
 
-ProjectSortField = Literal["name", "status", "created_at", "updated_at"]
+ProjectSortField = Literal["name", "status", "created_at", "updated_at", "relevance"]
 SortDirection = Literal["asc", "desc"]
+ProjectFields = Annotated[frozenset[str] | None, Depends(sparse_fields(ProjectRead))]
 
 
 def _ensure_project_access(
@@ -37,7 +58,7 @@ def _ensure_project_access(
 
 @router.get("/", response_model=ProjectListResponse)
 async def list_projects(
-    session: DBDep,
+    session: ReadDBDep,
     _: CurrentSuperuser,
     skip: int = 0,
     limit: int = 50,
@@ -46,29 +67,62 @@ async def list_projects(
     owner_id: uuid.UUID | None = None,
     sort_by: ProjectSortField = "created_at",
     sort_dir: SortDirection = "desc",
-) -> ProjectListResponse:
+    cursor: str | None = None,
+    count: CountStrategy = "exact",
+    fields: ProjectFields = None,
+) -> Response:
     items = await crud_project.get_multi_filtered(
         session,
         skip=skip,
-        limit=limit,
+        limit=limit + 1,
         search=search,
         status=status,
         owner_id=owner_id,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
+        fields=fields,
+        rows=True,
     )
-    total = await crud_project.get_count_filtered(
-        session,
-        search=search,
-        status=status,
-        owner_id=owner_id,
+    page, has_more = items[:limit], len(items) > limit
+    total: int | None = None
+    if count != "none":
+        total = await crud_project.get_count_filtered(
+            session,
+            search=search,
+            status=status,
+            owner_id=owner_id,
+            estimate=count == "estimated",
+        )
+    next_cursor = crud_project.get_next_cursor(
+        page, has_more=has_more, sort_by=sort_by, sort_dir=sort_dir
+    )
+    if fields is not None:
+        return sparse_list_response(
+            page,
+            fields,
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+    return FastJSONResponse(
+        ProjectListResponse(
+            items=list(page),  # type: ignore[arg-type]
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
     )
-    return ProjectListResponse(items=list(items), total=total, skip=skip, limit=limit)  # type: ignore[arg-type]
 
 
-@router.get("/me", response_model=ProjectListResponse)
+@router.get("/me", response_model=ProjectListResponse, responses=NOT_MODIFIED_RESPONSE)
 async def list_my_projects(
-    session: DBDep,
+    request: Request,
+    session: ReadDBDep,
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 50,
@@ -76,35 +130,91 @@ async def list_my_projects(
     status: str | None = None,
     sort_by: ProjectSortField = "created_at",
     sort_dir: SortDirection = "desc",
-) -> ProjectListResponse:
+    cursor: str | None = None,
+    count: CountStrategy = "exact",
+    fields: ProjectFields = None,
+) -> Response:
+    validators = await get_collection_validators(
+        request, session, scope="projects", key=current_user.id
+    )
+    if is_not_modified(request, validators):
+        return not_modified(validators)
+
     items = await crud_project.get_multi_filtered(
         session,
         skip=skip,
-        limit=limit,
+        limit=limit + 1,
         search=search,
         status=status,
         owner_id=current_user.id,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
+        fields=fields,
+        rows=True,
     )
-    total = await crud_project.get_count_filtered(
-        session,
-        search=search,
-        status=status,
-        owner_id=current_user.id,
+    page, has_more = items[:limit], len(items) > limit
+    total: int | None = None
+    if count != "none":
+        total = await crud_project.get_count_filtered(
+            session,
+            search=search,
+            status=status,
+            owner_id=current_user.id,
+            estimate=count == "estimated",
+        )
+    next_cursor = crud_project.get_next_cursor(
+        page, has_more=has_more, sort_by=sort_by, sort_dir=sort_dir
+    )
+    if fields is not None:
+        return sparse_list_response(
+            page,
+            fields,
+            headers=validators.headers,
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+    return FastJSONResponse(
+        ProjectListResponse(
+            items=list(page),  # type: ignore[arg-type]
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        ),
+        headers=validators.headers,
     )
-    return ProjectListResponse(items=list(items), total=total, skip=skip, limit=limit)  # type: ignore[arg-type]
 
 
-@router.get("/{project_id}", response_model=ProjectRead)
+@router.get("/suggest", response_model=list[ProjectSuggestion])
+async def suggest_projects(
+    session: ReadDBDep,
+    current_user: CurrentUser,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> Sequence[Row[tuple[uuid.UUID, str]]]:
+    """Typeahead suggestions from the current user's project names."""
+    return await crud_project.suggest(
+        session, query=q, owner_id=current_user.id, limit=limit
+    )
+
+
+@router.get(
+    "/{project_id}", response_model=ProjectRead, responses=NOT_MODIFIED_RESPONSE
+)
 async def get_project(
+    request: Request,
     project_id: uuid.UUID,
-    session: DBDep,
+    session: ReadDBDep,
     current_user: CurrentUser,
-) -> Project:
+) -> Response:
     project = await crud_project.get(session, id=project_id, raise_404_error=True)
     _ensure_project_access(project.owner_id, current_user)
-    return project
+    return conditional_response(request, ProjectRead, project)
 
 
 @router.post("/", response_model=ProjectRead, status_code=status.HTTP_201_CREATED)
@@ -121,6 +231,23 @@ async def create_project(
     return await crud_project.create(session, obj_in=ProjectCreate(**project_data))
 
 
+@router.post(
+    "/bulk", response_model=list[ProjectRead], status_code=status.HTTP_201_CREATED
+)
+async def create_projects_bulk(
+    projects_in: Annotated[
+        list[ProjectCreate],
+        Body(min_length=1, max_length=settings.BULK_MAX_ITEMS),
+    ],
+    session: DBDep,
+    current_user: CurrentUser,
+) -> Sequence[Project]:
+    for project_in in projects_in:
+        if not current_user.is_admin or project_in.owner_id is None:
+            project_in.owner_id = current_user.id
+    return await crud_project.create_many(session, objs_in=projects_in)
+
+
 @router.patch("/{project_id}", response_model=ProjectRead)
 async def update_project(
     project_id: uuid.UUID,
@@ -141,9 +268,28 @@ async def delete_project(
     session: DBDep,
     current_user: CurrentUser,
 ) -> Project:
+    """Soft-delete a project; it and its tasks can be restored until purged."""
     project = await crud_project.get(session, id=project_id, raise_404_error=True)
     _ensure_project_access(project.owner_id, current_user)
-    await session.execute(delete(Task).where(col(Task.project_id) == project_id))
-    await session.delete(project)
+    deleted = await crud_project.remove(session, id=project.id)
     await session.commit()
-    return project
+    return deleted or project
+
+
+@router.post("/{project_id}/restore", response_model=ProjectRead)
+async def restore_project(
+    project_id: uuid.UUID,
+    session: DBDep,
+    current_user: CurrentUser,
+) -> Project:
+    project = await crud_project.get(
+        session, id=project_id, raise_404_error=True, include_deleted=True
+    )
+    _ensure_project_access(project.owner_id, current_user)
+    restored = await crud_project.restore(session, id=project.id)
+    if not restored:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Project not found",
+        )
+    return restored
@@ -1,22 +1,54 @@
 import uuid
-from typing import Literal
+from collections.abc import Collection, Sequence
+from typing import Annotated, Literal
 
-from fastapi import APIRouter, HTTPException, status
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    HTTPException,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from sqlalchemy import ColumnElement, Row, select
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
 
-from app.api.deps import CurrentUser, DBDep
+from app.api.conditional import (
+    NOT_MODIFIED_RESPONSE,
+    Validators,
+    conditional_response,
+    get_collection_validators,
+    is_not_modified,
+    not_modified,
+)
+from app.api.deps import CurrentUser, DBDep, ReadDBDep
+from app.api.sparse import sparse_fields, sparse_list_response
+from app.core.config import settings
+from app.core.responses import FastJSONResponse
+from app.crud.base import CountStrategy
+from app.crud.loader import get_loader
 from app.crud.project import project as crud_project
 from app.crud.task import task as crud_task
 from app.models.project import Project
 from app.models.task import Task
-from app.schemas.task import TaskCreate, TaskListResponse, TaskRead, TaskUpdate
+from app.schemas.task import (
+    TaskCreate,
+    TaskListResponse,
+    TaskRead,
+    TaskSuggestion,
+    TaskUpdate,
+)
 
 router = APIRouter(prefix="/tasks", tags=["tasks"])
 
 TaskSortField = Literal[
-    "title", "status", "priority", "due_date", "created_at", "updated_at"
+    "title", "status", "priority", "due_date", "created_at", "updated_at", "relevance"
 ]
 SortDirection = Literal["asc", "desc"]
+TaskFields = Annotated[frozenset[str] | None, Depends(sparse_fields(TaskRead))]
 
 
 async def _get_project_for_access(
@@ -24,23 +56,37 @@ async def _get_project_for_access(
     project_id: uuid.UUID,
     current_user: CurrentUser,
 ) -> Project:
-    project = await crud_project.get(session, id=project_id)
-    if not project:
+    (project,) = await _get_projects_for_access(session, [project_id], current_user)
+    return project
+
+
+async def _get_projects_for_access(
+    session: AsyncSession,
+    project_ids: Collection[uuid.UUID],
+    current_user: CurrentUser,
+) -> Sequence[Project]:
+    """Load and access-check projects; checks awaited together share one query."""
+    loaded = await get_loader(session).load_many(crud_project, project_ids)
+    projects = [project for project in loaded if project is not None]
+    if len(projects) != len(loaded):
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Project not found",
         )
-    if not current_user.is_admin and project.owner_id != current_user.id:
+    if not current_user.is_admin and any(
+        project.owner_id != current_user.id for project in projects
+    ):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
         )
-    return project
+    return projects
 
 
-@router.get("/", response_model=TaskListResponse)
+@router.get("/", response_model=TaskListResponse, responses=NOT_MODIFIED_RESPONSE)
 async def list_tasks(
-    session: DBDep,
+    request: Request,
+    session: ReadDBDep,
     current_user: CurrentUser,
     skip: int = 0,
     limit: int = 50,
@@ -49,7 +95,10 @@ async def list_tasks(
     project_id: uuid.UUID | None = None,
     sort_by: TaskSortField = "created_at",
     sort_dir: SortDirection = "desc",
-) -> TaskListResponse:
+    cursor: str | None = None,
+    count: CountStrategy = "exact",
+    fields: TaskFields = None,
+) -> Response:
     if not current_user.is_admin:
         if not project_id:
             raise HTTPException(
@@ -58,34 +107,94 @@ async def list_tasks(
             )
         await _get_project_for_access(session, project_id, current_user)
 
+    # Only lists scoped to a project have a collection version
+    validators: Validators | None = None
+    if project_id:
+        validators = await get_collection_validators(
+            request, session, scope="tasks", key=project_id
+        )
+        if is_not_modified(request, validators):
+            return not_modified(validators)
+    headers = validators.headers if validators else None
+
     items = await crud_task.get_multi_filtered(
         session,
         skip=skip,
-        limit=limit,
+        limit=limit + 1,
         search=search,
         status=task_status,
         project_id=project_id,
         sort_by=sort_by,
         sort_dir=sort_dir,
+        cursor=cursor,
+        fields=fields,
+        rows=True,
+    )
+    page, has_more = items[:limit], len(items) > limit
+    total: int | None = None
+    if count != "none":
+        total = await crud_task.get_count_filtered(
+            session,
+            search=search,
+            status=task_status,
+            project_id=project_id,
+            estimate=count == "estimated",
+        )
+    next_cursor = crud_task.get_next_cursor(
+        page, has_more=has_more, sort_by=sort_by, sort_dir=sort_dir
     )
-    total = await crud_task.get_count_filtered(
+    if fields is not None:
+        return sparse_list_response(
+            page,
+            fields,
+            headers=headers,
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        )
+    return FastJSONResponse(
+        TaskListResponse(
+            items=list(page),  # type: ignore[arg-type]
+            total=total,
+            skip=skip,
+            limit=limit,
+            has_more=has_more,
+            next_cursor=next_cursor,
+        ),
+        headers=headers,
+    )
+
+
+@router.get("/suggest", response_model=list[TaskSuggestion])
+async def suggest_tasks(
+    session: ReadDBDep,
+    current_user: CurrentUser,
+    q: Annotated[str, Query(min_length=1, max_length=200)],
+    project_id: uuid.UUID | None = None,
+    limit: Annotated[int, Query(ge=1, le=50)] = 10,
+) -> Sequence[Row[tuple[uuid.UUID, str]]]:
+    """Typeahead suggestions from task titles in the current user's projects."""
+    return await crud_task.suggest(
         session,
-        search=search,
-        status=task_status,
+        query=q,
+        owner_id=current_user.id,
         project_id=project_id,
+        limit=limit,
     )
-    return TaskListResponse(items=list(items), total=total, skip=skip, limit=limit)  # type: ignore[arg-type]
 
 
-@router.get("/{task_id}", response_model=TaskRead)
+@router.get("/{task_id}", response_model=TaskRead, responses=NOT_MODIFIED_RESPONSE)
 async def get_task(
+    request: Request,
     task_id: uuid.UUID,
-    session: DBDep,
+    session: ReadDBDep,
     current_user: CurrentUser,
-) -> Task:
+) -> Response:
     task = await crud_task.get(session, id=task_id, raise_404_error=True)
     await _get_project_for_access(session, task.project_id, current_user)
-    return task
+    return conditional_response(request, TaskRead, task)
 
 
 @router.post("/", response_model=TaskRead, status_code=status.HTTP_201_CREATED)
@@ -98,6 +207,47 @@ async def create_task(
     return await crud_task.create(session, obj_in=task_in)
 
 
+@router.post(
+    "/bulk", response_model=list[TaskRead], status_code=status.HTTP_201_CREATED
+)
+async def create_tasks_bulk(
+    tasks_in: Annotated[
+        list[TaskCreate],
+        Body(min_length=1, max_length=settings.BULK_MAX_ITEMS),
+    ],
+    session: DBDep,
+    current_user: CurrentUser,
+) -> Sequence[Task]:
+    await _get_projects_for_access(
+        session, {task_in.project_id for task_in in tasks_in}, current_user
+    )
+    return await crud_task.create_many(session, objs_in=tasks_in)
+
+
+@router.patch("/bulk", response_model=list[TaskRead])
+async def update_tasks_bulk(
+    ids: Annotated[
+        list[uuid.UUID],
+        Body(min_length=1, max_length=settings.BULK_MAX_ITEMS),
+    ],
+    patch: Annotated[TaskUpdate, Body()],
+    session: DBDep,
+    current_user: CurrentUser,
+) -> Sequence[Task]:
+    """Apply one patch to many tasks, skipping tasks the user may not edit."""
+    if patch.project_id:
+        await _get_project_for_access(session, patch.project_id, current_user)
+
+    where: list[ColumnElement[bool]] = []
+    if not current_user.is_admin:
+        owned_projects = select(col(Project.id)).where(
+            col(Project.owner_id) == current_user.id,
+            col(Project.deleted_at).is_(None),
+        )
+        where.append(col(Task.project_id).in_(owned_projects))
+    return await crud_task.update_many(session, ids=ids, obj_in=patch, where=where)
+
+
 @router.patch("/{task_id}", response_model=TaskRead)
 async def update_task(
     task_id: uuid.UUID,
@@ -106,9 +256,11 @@ async def update_task(
     current_user: CurrentUser,
 ) -> Task:
     task = await crud_task.get(session, id=task_id, raise_404_error=True)
-    await _get_project_for_access(session, task.project_id, current_user)
+    # The current and the target project are checked with one query
+    project_ids = {task.project_id}
     if task_in.project_id:
-        await _get_project_for_access(session, task_in.project_id, current_user)
+        project_ids.add(task_in.project_id)
+    await _get_projects_for_access(session, project_ids, current_user)
     return await crud_task.update(session, db_obj=task, obj_in=task_in)
 
 
@@ -118,8 +270,28 @@ async def delete_task(
     session: DBDep,
     current_user: CurrentUser,
 ) -> Task:
+    """Soft-delete a task; it can be restored until purged."""
     task = await crud_task.get(session, id=task_id, raise_404_error=True)
     await _get_project_for_access(session, task.project_id, current_user)
-    await session.delete(task)
+    deleted = await crud_task.remove(session, id=task.id)
     await session.commit()
-    return task
+    return deleted or task
+
+
+@router.post("/{task_id}/restore", response_model=TaskRead)
+async def restore_task(
+    task_id: uuid.UUID,
+    session: DBDep,
+    current_user: CurrentUser,
+) -> Task:
+    task = await crud_task.get(
+        session, id=task_id, raise_404_error=True, include_deleted=True
+    )
+    await _get_project_for_access(session, task.project_id, current_user)
+    restored = await crud_task.restore(session, id=task.id)
+    if not restored:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Task not found",
+        )
+    return restored
@@ -5,7 +5,14 @@ from typing import Any
 
 from fastapi import APIRouter, Depends, HTTPException, status
 
-from app.api.deps import CurrentSuperuser, CurrentUser, DBDep, auth0, current_user
+from app.api.deps import (
+    CurrentSuperuser,
+    CurrentUser,
+    DBDep,
+    ReadDBDep,
+    auth0,
+    current_user,
+)
 from app.core.config import settings
 from app.crud.user import user as crud_user
 from app.logic.auth0.auth0_service import delete_auth0_user, update_auth0_user
@@ -96,7 +103,7 @@ async def get_auth0_management_url(
 
 @router.get("/", response_model=list[UserRead])
 async def list_users(
-    session: DBDep,
+    session: ReadDBDep,
     _: CurrentSuperuser,
     skip: int = 0,
     limit: int = 100,
@@ -107,7 +114,7 @@ async def list_users(
 @router.get("/{user_id}", response_model=UserRead)
 async def get_user(
     user_id: uuid.UUID,
-    session: DBDep,
+    session: ReadDBDep,
     _: CurrentSuperuser,
 ) -> User:
     return await crud_user.get(session, id=user_id, raise_404_error=True)
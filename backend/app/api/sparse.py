@@ -0,0 +1,58 @@
+"""Sparse fieldsets for list endpoints, e.g. `GET /tasks/?fields=title,status`."""
+
+from collections.abc import Callable, Collection, Mapping, Sequence
+from typing import Annotated, Any
+
+from fastapi import HTTPException, Query, status
+from pydantic import BaseModel
+
+from app.core.responses import FastJSONResponse
+
+FIELDS_DESCRIPTION = (
+    "Comma-separated item fields to return; `id` is always included. "
+    "Only these columns are loaded. Omit to return every field."
+)
+
+
+def sparse_fields(
+    schema: type[BaseModel],
+) -> Callable[..., frozenset[str] | None]:
+    """Dependency parsing `fields` into a set of `schema` field names."""
+    allowed = frozenset(schema.model_fields)
+
+    def _sparse_fields(
+        fields: Annotated[str | None, Query(description=FIELDS_DESCRIPTION)] = None,
+    ) -> frozenset[str] | None:
+        if fields is None:
+            return None
+        requested = {name.strip() for name in fields.split(",") if name.strip()}
+        unknown = requested - allowed
+        if unknown:
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail=f"Unknown fields: {', '.join(sorted(unknown))}",
+            )
+        return frozenset(requested | {"id"})
+
+    return _sparse_fields
+
+
+def sparse_list_response(
+    items: Sequence[Any],
+    fields: Collection[str],
+    *,
+    headers: Mapping[str, str] | None = None,
+    **meta: Any,
+) -> FastJSONResponse:
+    """
+    List response with only `fields` per item.
+
+    Returned directly instead of through the endpoint's `response_model`, whose
+    item schema requires every field; reading only `fields` also keeps the
+    attributes that were not loaded untouched.
+    """
+    content = {
+        "items": [{name: getattr(item, name) for name in fields} for item in items],
+        **meta,
+    }
+    return FastJSONResponse(content, headers=headers)
@@ -70,6 +70,70 @@ class Settings(BaseSettings):
             path=self.POSTGRES_DB,
         )
 
+    # Connection pool, per worker process and per engine (primary and replica).
+    # Keep workers * (POOL_SIZE + MAX_OVERFLOW) below the server's max_connections.
+    POSTGRES_POOL_SIZE: int = 5
+    POSTGRES_MAX_OVERFLOW: int = 10
+    # Seconds a request waits for a free connection before failing
+    POSTGRES_POOL_TIMEOUT: float = 30.0
+    # Replace connections older than this many seconds; -1 keeps them forever
+    POSTGRES_POOL_RECYCLE: int = 1800
+    # Test each connection on checkout so restarts and idle timeouts do not
+    # surface as request errors, at the cost of one round trip per checkout
+    POSTGRES_POOL_PRE_PING: bool = True
+    # Set when connecting through PgBouncer in transaction pooling mode, which
+    # cannot keep prepared statements across transactions
+    POSTGRES_PGBOUNCER: bool = False
+    # Prepared statements cached per connection, so hot queries skip parsing and
+    # planning; forced to 0 in PgBouncer mode
+    POSTGRES_STATEMENT_CACHE_SIZE: int = 500
+    # Shown in pg_stat_activity; defaults to PROJECT_NAME
+    POSTGRES_APPLICATION_NAME: str | None = None
+    # JIT compilation only pays off for long analytical queries and adds
+    # latency to short OLTP ones
+    POSTGRES_JIT: bool = False
+    # Start the read-only transactions of GET endpoints as DEFERRABLE. Only
+    # takes effect under SERIALIZABLE isolation, where such a transaction waits
+    # for a safe snapshot once and then runs without serialization checks.
+    POSTGRES_READ_ONLY_DEFERRABLE: bool = False
+
+    # Optional streaming replica that serves GET endpoints. Unset fields fall back
+    # to the primary's values; without POSTGRES_REPLICA_SERVER all reads use the
+    # primary.
+    POSTGRES_REPLICA_SERVER: str | None = None
+    POSTGRES_REPLICA_PORT: int | None = None
+    POSTGRES_REPLICA_USER: str | None = None
+    POSTGRES_REPLICA_PASSWORD: str | None = None
+    POSTGRES_REPLICA_DB: str | None = None
+    # After a write, the writer's reads go to the primary for this many seconds,
+    # so they see their own changes despite replication lag
+    POSTGRES_REPLICA_READ_YOUR_WRITES_SECONDS: float = 5.0
+    # Signs the cookie carrying that pin; required with a replica, and the same
+    # for every worker and pod
+    POSTGRES_REPLICA_PIN_SECRET: str | None = None
+
+    @model_validator(mode="after")
+    def _check_replica_pin_secret(self) -> Self:
+        if self.POSTGRES_REPLICA_SERVER and not self.POSTGRES_REPLICA_PIN_SECRET:
+            raise ValueError(
+                "POSTGRES_REPLICA_PIN_SECRET is required with POSTGRES_REPLICA_SERVER"
+            )
+        return self
+
+    @computed_field  # type: ignore[prop-decorator]
+    @property
+    def SQLALCHEMY_REPLICA_DATABASE_URI(self) -> MultiHostUrl | None:
+        if not self.POSTGRES_REPLICA_SERVER:
+            return None
+        return MultiHostUrl.build(
+            scheme="postgresql+asyncpg",
+            username=self.POSTGRES_REPLICA_USER or self.POSTGRES_USER,
+            password=self.POSTGRES_REPLICA_PASSWORD or self.POSTGRES_PASSWORD,
+            host=self.POSTGRES_REPLICA_SERVER,
+            port=self.POSTGRES_REPLICA_PORT or self.POSTGRES_PORT,
+            path=self.POSTGRES_REPLICA_DB or self.POSTGRES_DB,
+        )
+
     SMTP_TLS: bool = True
     SMTP_SSL: bool = False
     SMTP_PORT: int = 587
@@ -95,6 +159,17 @@ class Settings(BaseSettings):
 
     EMAIL_RESET_TOKEN_EXPIRE_HOURS: int = 48
 
+    # Maximum number of items accepted by a single bulk endpoint request
+    BULK_MAX_ITEMS: int = 500
+
+    # Soft-deleted projects and tasks can be restored for this many days before
+    # the purge job (app/scripts/purge_deleted.py) removes them for good
+    SOFT_DELETE_RETENTION_DAYS: int = 30
+    # Rows removed per purge transaction, keeping locks and WAL bursts small
+    SOFT_DELETE_PURGE_BATCH_SIZE: int = 500
+    # Pause between purge runs; 0 runs the purge once and exits (e.g. for cron)
+    SOFT_DELETE_PURGE_INTERVAL_SECONDS: int = 3600
+
     @computed_field  # type: ignore[prop-decorator]
     @property
     def emails_enabled(self) -> bool:
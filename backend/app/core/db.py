@@ -1,16 +1,230 @@
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+import hashlib
+import hmac
+import time
+import uuid
+from typing import Any
+
+import orjson
+from pydantic_core import MultiHostUrl
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
+from sqlalchemy.orm import ORMExecuteState, Session
+from sqlalchemy.pool import AsyncAdaptedQueuePool, ConnectionPoolEntry
 
 from app.core.config import settings
 
-engine = create_async_engine(
-    str(settings.SQLALCHEMY_DATABASE_URI), echo=False, future=True
-)
+
+class InstrumentedPool(AsyncAdaptedQueuePool):
+    """Queue pool that also records how long checkouts wait for a connection.
+
+    The counters are per process, so each worker reports its own pool.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.waiting = 0
+        self.checkouts = 0
+        self.wait_seconds_total = 0.0
+        self.wait_seconds_max = 0.0
+
+    def _do_get(self) -> ConnectionPoolEntry:
+        self.waiting += 1
+        start = time.perf_counter()
+        try:
+            return super()._do_get()
+        finally:
+            elapsed = time.perf_counter() - start
+            self.waiting -= 1
+            self.checkouts += 1
+            self.wait_seconds_total += elapsed
+            self.wait_seconds_max = max(self.wait_seconds_max, elapsed)
+
+
+def _json_dumps(value: Any) -> str:
+    return orjson.dumps(value).decode()
+
+
+def _create_engine(url: str | MultiHostUrl) -> AsyncEngine:
+    server_settings = {
+        "application_name": settings.POSTGRES_APPLICATION_NAME or settings.PROJECT_NAME
+    }
+    connect_args: dict[str, Any] = {
+        "statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        "prepared_statement_cache_size": settings.POSTGRES_STATEMENT_CACHE_SIZE,
+        "server_settings": server_settings,
+    }
+    if settings.POSTGRES_PGBOUNCER:
+        # Transaction pooling hands each transaction to any server connection,
+        # so statements must not be cached and need unique names. PgBouncer
+        # also rejects startup parameters it does not track, such as jit.
+        connect_args.update(
+            statement_cache_size=0,
+            prepared_statement_cache_size=0,
+            prepared_statement_name_func=lambda: f"__asyncpg_{uuid.uuid4()}__",
+        )
+    elif not settings.POSTGRES_JIT:
+        server_settings["jit"] = "off"
+
+    new_engine = create_async_engine(
+        str(url),
+        echo=False,
+        future=True,
+        poolclass=InstrumentedPool,
+        pool_size=settings.POSTGRES_POOL_SIZE,
+        max_overflow=settings.POSTGRES_MAX_OVERFLOW,
+        pool_timeout=settings.POSTGRES_POOL_TIMEOUT,
+        pool_recycle=settings.POSTGRES_POOL_RECYCLE,
+        pool_pre_ping=settings.POSTGRES_POOL_PRE_PING,
+        json_serializer=_json_dumps,
+        json_deserializer=orjson.loads,
+        connect_args=connect_args,
+    )
+    return new_engine
+
+
+class WriteTrackingSession(Session):
+    """Session that remembers whether its current transaction wrote anything.
+
+    See `has_writes`; INSERT, UPDATE and DELETE statements and flushes count
+    as writes. Other statements, such as `text()` or `Explain`, are taken as
+    reads, so raw SQL that writes has to be committed explicitly.
+    """
+
+
+@event.listens_for(WriteTrackingSession, "do_orm_execute")
+def _track_statement(orm_execute_state: ORMExecuteState) -> None:  # pyright: ignore[reportUnusedFunction]
+    if orm_execute_state.statement.is_dml:
+        orm_execute_state.session.info["has_writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_flush")
+def _track_flush(session: Session, flush_context: Any) -> None:  # noqa ARG001  # pyright: ignore[reportUnusedFunction]
+    session.info["has_writes"] = True
+
+
+@event.listens_for(WriteTrackingSession, "after_commit")
+@event.listens_for(WriteTrackingSession, "after_rollback")
+def _reset_writes(session: Session) -> None:  # pyright: ignore[reportUnusedFunction]
+    session.info.pop("has_writes", None)
+
+
+def has_writes(session: AsyncSession) -> bool:
+    """Whether `session` has written, or holds changes a commit would flush."""
+    return bool(
+        session.info.get("has_writes")
+        or session.new
+        or session.dirty
+        or session.deleted
+    )
+
+
+engine = _create_engine(settings.SQLALCHEMY_DATABASE_URI)
+# Sessions check out a connection on their first query, not when created
 async_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
     engine,
     class_=AsyncSession,
+    sync_session_class=WriteTrackingSession,
     expire_on_commit=False,
 )
 
+
+def _read_only(engine: AsyncEngine) -> AsyncEngine:
+    # BEGIN itself carries READ ONLY, so this costs no extra round trip
+    return engine.execution_options(
+        postgresql_readonly=True,
+        postgresql_deferrable=settings.POSTGRES_READ_ONLY_DEFERRABLE,
+    )
+
+
+# Sessions for GET endpoints, see `app.api.deps.get_read_db`. They never write,
+# so autoflush is off and they are closed rather than committed.
+read_session: async_sessionmaker[AsyncSession] = async_sessionmaker(
+    _read_only(engine),
+    class_=AsyncSession,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
+# Optional read replica for GET endpoints
+replica_engine = (
+    _create_engine(settings.SQLALCHEMY_REPLICA_DATABASE_URI)
+    if settings.SQLALCHEMY_REPLICA_DATABASE_URI
+    else None
+)
+replica_session: async_sessionmaker[AsyncSession] | None = (
+    async_sessionmaker(
+        _read_only(replica_engine),
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+    if replica_engine
+    else None
+)
+
+
+class PrimaryPins:
+    """Read-your-writes pins, carried by the client in a signed cookie.
+
+    After a write the client gets `COOKIE`, holding the time until which its
+    reads must go to the primary, so the pin holds whichever worker or replica
+    pod serves its next request. The signature keeps clients from extending it.
+    """
+
+    COOKIE = "primary_until"
+
+    def __init__(self, seconds: float, secret: str):
+        self.seconds = seconds
+        self._key = secret.encode()
+
+    def pin(self) -> str:
+        """Cookie value pinning the client to the primary for `seconds`."""
+        until = f"{time.time() + self.seconds:.3f}"
+        return f"{until}.{self._sign(until)}"
+
+    def is_pinned(self, value: str | None) -> bool:
+        if not value:
+            return False
+        until, _, signature = value.rpartition(".")
+        if not hmac.compare_digest(signature.encode(), self._sign(until).encode()):
+            return False
+        return time.time() < float(until)
+
+    def _sign(self, value: str) -> str:
+        return hmac.new(self._key, value.encode(), hashlib.sha256).hexdigest()
+
+
+primary_pins = PrimaryPins(
+    settings.POSTGRES_REPLICA_READ_YOUR_WRITES_SECONDS,
+    settings.POSTGRES_REPLICA_PIN_SECRET or "",
+)
+
+
+def get_pool_stats(engine: AsyncEngine) -> dict[str, Any]:
+    """Snapshot of an engine's connection pool in this worker process."""
+    pool = engine.pool
+    if not isinstance(pool, InstrumentedPool):
+        return {"status": pool.status()}
+    return {
+        "size": pool.size(),
+        "checked_in": pool.checkedin(),
+        "checked_out": pool.checkedout(),
+        "overflow": pool.overflow(),
+        "waiting": pool.waiting,
+        "checkouts": pool.checkouts,
+        "wait_seconds_total": pool.wait_seconds_total,
+        "wait_seconds_max": pool.wait_seconds_max,
+        "wait_seconds_avg": (
+            pool.wait_seconds_total / pool.checkouts if pool.checkouts else 0.0
+        ),
+    }
+
+
 # make sure all SQLModel models are imported (app.models) before initializing DB
 # otherwise, SQLModel might fail to initialize relationships properly
 # for more details: https://github.com/fastapi/full-stack-fastapi-template/issues/28
@@ -0,0 +1,48 @@
+"""JSON responses that skip the intermediate dict + `json.dumps` pass.
+
+`FastJSONResponse` is the app's default response class. Endpoints on hot paths
+return it directly, built from a schema instance, so FastAPI neither validates
+the value against `response_model` again nor turns it into a dict first; see
+`app/scripts/benchmark_serialization.py`.
+"""
+
+from functools import cache
+from typing import Any
+
+import orjson
+from fastapi.responses import JSONResponse, Response
+from pydantic import BaseModel, TypeAdapter
+from pydantic_core import to_jsonable_python
+
+
+@cache
+def get_type_adapter(tp: Any) -> TypeAdapter[Any]:
+    """`TypeAdapter` for `tp`, whose validator and serializer are compiled once."""
+    return TypeAdapter(tp)
+
+
+class FastJSONResponse(JSONResponse):
+    """
+    JSON response rendered by pydantic-core or orjson.
+
+    Pydantic models are dumped straight to JSON bytes by their compiled
+    serializer. Other content, such as the dicts FastAPI produces from a
+    `response_model`, is encoded with orjson.
+    """
+
+    def render(self, content: Any) -> bytes:
+        if isinstance(content, BaseModel):
+            return get_type_adapter(type(content)).dump_json(content)
+        return orjson.dumps(content, default=to_jsonable_python)
+
+
+def serialize_as(schema: Any, value: Any, **kwargs: Any) -> Response:
+    """
+    Validates `value`, e.g. an ORM object, as `schema` and renders it as JSON.
+
+    Endpoints still declare `schema` as their `response_model` for the OpenAPI
+    document; returning the response skips FastAPI's own serialization.
+    """
+    adapter = get_type_adapter(schema)
+    body = adapter.dump_json(adapter.validate_python(value, from_attributes=True))
+    return Response(body, media_type=FastJSONResponse.media_type, **kwargs)
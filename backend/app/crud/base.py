@@ -1,28 +1,54 @@
-import datetime
-from collections.abc import AsyncGenerator, Sequence
+import uuid
+from collections import OrderedDict
+from collections.abc import AsyncGenerator, Callable, Collection, Hashable, Sequence
+from datetime import datetime
 from typing import (
     Any,
     Generic,
     Literal,
     NamedTuple,
     TypeVar,
+    cast,
     overload,
 )
-from zoneinfo import ZoneInfo
 
 from fastapi import HTTPException
 from fastapi.encoders import jsonable_encoder
-from pydantic import BaseModel
-from sqlalchemy import delete, func, select
+from pydantic import BaseModel, TypeAdapter
+from sqlalchemy import (
+    ColumnElement,
+    CursorResult,
+    Executable,
+    Row,
+    Select,
+    Table,
+    any_,
+    bindparam,
+    delete,
+    func,
+    insert,
+    select,
+    update,
+)
+from sqlalchemy.dialects.postgresql import ARRAY
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
+from sqlalchemy.orm import InstrumentedAttribute, defer, load_only, selectinload
+from sqlalchemy.orm.interfaces import ORMOption
 from sqlmodel import col
 from starlette import status
 
-from app.logic.utils.db_utils import get_comparison
-from app.models import Base
+from app.logic.utils.db_utils import (
+    Explain,
+    decode_cursor,
+    encode_cursor,
+    get_comparison,
+    get_keyset_condition,
+    get_plan_rows,
+)
+from app.models import Base, SoftDeleteBase
 
 ModelType = TypeVar("ModelType", bound=Base)
+StatementType = TypeVar("StatementType", bound=Executable)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 
@@ -34,6 +60,15 @@ class NamedFilterFields(NamedTuple):
     greater_then_comp: Literal["gt", "le"] | None = None
 
 
+SortDirection = Literal["asc", "desc"]
+CountStrategy = Literal["exact", "estimated", "none"]
+
+
+def _utc_now() -> ColumnElement[datetime]:
+    # Timestamps are stored as UTC without time zone, see `Base`
+    return func.timezone("UTC", func.clock_timestamp())
+
+
 excludeList = {
     "id",
     "created_on",
@@ -42,6 +77,13 @@ excludeList = {
 
 
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
+    # Columns list queries skip unless selected through `fields`, e.g. search
+    # documents that are only used for filtering
+    list_deferred: tuple[str, ...] = ()
+    # Statements kept by `_get_statement`. Keys include client input such as
+    # sparse `fields`, so the cache is bounded and evicts least recently used
+    statement_cache_size = 256
+
     def __init__(self, model: type[ModelType]):
         """
         CRUD object with default methods to Create, Read, Update, Delete (CRUD).
@@ -52,6 +94,50 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         * `schema`: A Pydantic model (schema) class
         """
         self.model = model
+        self._statements: OrderedDict[Hashable, Any] = OrderedDict()
+
+    @property
+    def _table(self) -> Table:
+        """The model's table, typed for column access."""
+        return cast(Table, self.model.__table__)  # type: ignore[attr-defined]
+
+    def _get_statement(
+        self, key: Hashable, build: Callable[[], StatementType]
+    ) -> StatementType:
+        """
+        Returns the statement cached under `key`, building it on first use.
+
+        Cached statements take their values as `bindparam`s passed to `execute()`,
+        so `key` only needs to describe the query shape (which filters are present,
+        the sort order, ...), never the values. Reusing the construct skips
+        rebuilding it on every call and lets SQLAlchemy reuse its memoized cache
+        key, see `app/scripts/benchmark_statements.py`. At most
+        `statement_cache_size` statements are kept.
+        """
+        statement = self._statements.get(key)
+        if statement is None:
+            statement = self._statements[key] = build()
+            if len(self._statements) > self.statement_cache_size:
+                self._statements.popitem(last=False)
+        else:
+            self._statements.move_to_end(key)
+        return statement
+
+    def clear_statement_cache(self) -> None:
+        """Drops all cached statements, e.g. to measure building them."""
+        self._statements.clear()
+
+    @property
+    def uses_soft_delete(self) -> bool:
+        """Whether `self.model` is a `SoftDeleteBase` model."""
+        return issubclass(self.model, SoftDeleteBase)
+
+    def _exclude_deleted(self, query: Select[Any]) -> Select[Any]:
+        # Every read path of a soft-delete model goes through here, which is also
+        # what lets the planner pick the partial `WHERE deleted_at IS NULL` indexes
+        if self.uses_soft_delete:
+            query = query.where(col(self.model.deleted_at).is_(None))  # type: ignore[attr-defined]
+        return query
 
     # These overloads allow the type checker to understand that
     # when `raise_404_error` is True, the return type is never None.
@@ -64,8 +150,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         raise_404_error: Literal[True],
         select_in_load: list[str] | None = None,
-    ) -> ModelType:
-        ...
+        include_deleted: bool = False,
+    ) -> ModelType: ...
 
     @overload
     async def get(  # noqa: E704
@@ -75,8 +161,8 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         raise_404_error: Literal[False] = False,
         select_in_load: list[str] | None = None,
-    ) -> ModelType | None:
-        ...
+        include_deleted: bool = False,
+    ) -> ModelType | None: ...
 
     async def get(
         self,
@@ -85,13 +171,14 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         raise_404_error: bool = False,
         select_in_load: list[str] | None = None,
+        include_deleted: bool = False,
     ) -> ModelType | None:
-        query = select(self.model).where(col(self.model.id) == id)
-        if select_in_load:
-            for attr in select_in_load:
-                query = query.options(selectinload(getattr(self.model, attr)))
-
-        result = await db.execute(query)
+        load = tuple(select_in_load or ())
+        query = self._get_statement(
+            ("get", include_deleted, load),
+            lambda: self._build_get_statement(load, include_deleted=include_deleted),
+        )
+        result = await db.execute(query, {"id": id})
         first = result.scalars().first()
         if not first and raise_404_error:
             raise HTTPException(
@@ -100,6 +187,35 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             )
         return first
 
+    def _build_get_statement(
+        self, select_in_load: Sequence[str], *, include_deleted: bool
+    ) -> Select[Any]:
+        query = select(self.model).where(col(self.model.id) == bindparam("id"))
+        if not include_deleted:
+            query = self._exclude_deleted(query)
+        for attr in select_in_load:
+            query = query.options(selectinload(getattr(self.model, attr)))
+        return query
+
+    async def get_by_ids(
+        self, db: AsyncSession, *, ids: Collection[Any]
+    ) -> Sequence[ModelType]:
+        """
+        Returns the rows with the given `ids`, in no particular order.
+
+        The ids are bound as one array parameter (`WHERE id = ANY(:ids)`), so
+        every batch size shares a single statement and prepared statement.
+        Missing and soft-deleted rows are left out.
+        """
+        query = self._get_statement("get_by_ids", self._build_get_by_ids_statement)
+        result = await db.execute(query, {"ids": list(ids)})
+        return result.scalars().all()
+
+    def _build_get_by_ids_statement(self) -> Select[Any]:
+        id_column = self._table.c.id
+        ids = bindparam("ids", type_=ARRAY(id_column.type))
+        return self._exclude_deleted(select(self.model).where(id_column == any_(ids)))
+
     # write a function that iterates over all elements in self.model and return n elements as yield
 
     async def get_multi(
@@ -108,10 +224,10 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *,
         skip: int = 0,
         limit: int = 100,
-        ids: list[str] | None = None,
+        ids: list[Any] | None = None,
         select_in_load: list[str] | None = None,
     ) -> Sequence[ModelType]:
-        query = select(self.model).offset(skip).limit(limit)
+        query = self._exclude_deleted(select(self.model).offset(skip).limit(limit))
         if ids:
             query = query.where(col(self.model.id).in_(ids))
 
@@ -122,54 +238,303 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await db.execute(query)
         return result.scalars().all()
 
-    async def remove_multi(self, db: AsyncSession, *, ids: list[int]) -> bool:
+    def get_cursor_params(
+        self, cursor: str, *, sort_by: str, sort_dir: SortDirection
+    ) -> dict[str, Any]:
+        """
+        Decodes `cursor` into the bind parameters used by `_apply_order`.
+
+        `cursor_value` is left out when the last sort value was NULL, which
+        changes the shape of the keyset condition.
+        """
+        sort_value, last_id = self._decode_cursor(
+            cursor, sort_by=sort_by, sort_dir=sort_dir
+        )
+        params: dict[str, Any] = {"cursor_id": last_id}
+        if sort_value is not None:
+            params["cursor_value"] = sort_value
+        return params
+
+    def _apply_order(
+        self,
+        query: Select[Any],
+        *,
+        sort_column: InstrumentedAttribute[Any] | ColumnElement[Any],
+        sort_dir: SortDirection,
+        params: Collection[str],
+    ) -> Select[Any]:
+        # Seeks past the `cursor_value`/`cursor_id` bind parameters if present
+        id_column = cast(InstrumentedAttribute[Any], col(self.model.id))
+        if "cursor_id" in params:
+            sort_value = (
+                bindparam("cursor_value", type_=sort_column.type)
+                if "cursor_value" in params
+                else None
+            )
+            query = query.where(
+                get_keyset_condition(
+                    sort_column,
+                    id_column,
+                    sort_value,
+                    bindparam("cursor_id", type_=self._table.c.id.type),
+                    sort_dir,
+                )
+            )
+
+        if sort_dir == "asc":
+            return query.order_by(sort_column.asc(), id_column.asc())
+        return query.order_by(sort_column.desc(), id_column.desc())
+
+    def _get_list_load_options(
+        self, fields: Collection[str] | None, *, sort_by: str
+    ) -> list[ORMOption]:
+        """
+        Loader options that limit a list query to the columns it returns.
+
+        With a sparse `fields` selection only those columns are loaded, plus `id`
+        and the sort column the next cursor is built from; other attributes raise
+        instead of lazy loading. Otherwise the `list_deferred` columns are left out.
+        """
+        if fields is None:
+            return [defer(getattr(self.model, name)) for name in self.list_deferred]
+
+        names = {"id", *fields}
+        if sort_by in self.model.model_fields:
+            names.add(sort_by)
+        columns = [getattr(self.model, name) for name in sorted(names)]
+        return [load_only(*columns, raiseload=True)]
+
+    def _get_list_columns(
+        self, fields: Collection[str] | None, *, sort_by: str
+    ) -> list[Any]:
+        """
+        Table columns of a list query in row mode, the same ones
+        `_get_list_load_options` would load.
+        """
+        table = self._table
+        if fields is None:
+            return [c for c in table.columns if c.key not in self.list_deferred]
+
+        names = {"id", *fields}
+        if sort_by in self.model.model_fields:
+            names.add(sort_by)
+        return [table.columns[name] for name in sorted(names)]
+
+    def _select_list(
+        self, fields: Collection[str] | None, *, sort_by: str, rows: bool
+    ) -> Select[Any]:
+        """
+        Base `SELECT` of a list query, before filters and ordering.
+
+        Selects model instances, or with `rows` the plain table columns, see
+        `_execute_list`.
+        """
+        if rows:
+            return select(*self._get_list_columns(fields, sort_by=sort_by))
+        return select(self.model).options(
+            *self._get_list_load_options(fields, sort_by=sort_by)
+        )
+
+    async def _execute_list(
+        self,
+        db: AsyncSession,
+        query: Select[Any],
+        params: dict[str, Any],
+        *,
+        rows: bool,
+    ) -> Sequence[ModelType] | Sequence[Row[Any]]:
+        """
+        Runs a list query built by `_select_list`.
+
+        In row mode the query runs on the session's connection, bypassing the
+        ORM: results are `Row` tuples with attribute access by column name and
+        never enter the identity map, which is cheaper for pages that are only
+        serialized, see `app/scripts/benchmark_list_rows.py`. Pending changes
+        are not flushed first, and the rows are not kept up to date by later
+        changes in the session.
+        """
+        if rows:
+            connection = await db.connection()
+            return (await connection.execute(query, params)).all()
+        return (await db.execute(query, params)).scalars().all()
+
+    def get_next_cursor(
+        self,
+        items: Sequence[ModelType] | Sequence[Row[Any]],
+        *,
+        has_more: bool,
+        sort_by: str,
+        sort_dir: SortDirection,
+    ) -> str | None:
+        """
+        Returns the cursor for the page after `items`, or None on the last page.
+
+        Sort keys that are computed per query (e.g. search relevance) cannot be
+        encoded in a cursor and also return None; use `skip` for those.
+        """
+        if not items or not has_more or sort_by not in self.model.model_fields:
+            return None
+        last = items[-1]
+        return encode_cursor(
+            jsonable_encoder(
+                {
+                    "sort_by": sort_by,
+                    "sort_dir": sort_dir,
+                    "value": getattr(last, sort_by),
+                    "id": last.id,
+                }
+            )
+        )
+
+    def _decode_cursor(
+        self,
+        cursor: str,
+        *,
+        sort_by: str,
+        sort_dir: SortDirection,
+    ) -> tuple[Any, uuid.UUID]:
+        payload = decode_cursor(cursor)
+        try:
+            if (
+                payload is None
+                or payload["sort_by"] != sort_by
+                or payload["sort_dir"] != sort_dir
+            ):
+                raise ValueError("cursor does not match the requested sort order")
+            last_id = uuid.UUID(payload["id"])
+            annotation = self.model.model_fields[sort_by].annotation
+            adapter: TypeAdapter[Any] = TypeAdapter(annotation)
+            value = adapter.validate_python(payload["value"])
+        except (KeyError, TypeError, ValueError):
+            raise HTTPException(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                detail="Invalid cursor",
+            )
+        return value, last_id
+
+    async def remove_multi(self, db: AsyncSession, *, ids: list[Any]) -> bool:
+        if self.uses_soft_delete:
+            await db.execute(
+                self._get_soft_delete_statement(col(self.model.id).in_(ids))
+            )
+            return True
+
         await db.execute(delete(self.model).where(col(self.model.id).in_(ids)))
         return True
 
     async def create(self, db: AsyncSession, *, obj_in: CreateSchemaType) -> ModelType:
-        # get all fields from obj_in that have type datetime or date
-        datetime_fields = [
-            (property, value)
-            for property, value in vars(obj_in).items()
-            if type(value) in (datetime.datetime, datetime.date)
-        ]
-
-        obj_in_data = jsonable_encoder(obj_in)
-        for property, value in datetime_fields:
-            obj_in_data[property] = value
-
-        db_obj = self.model(**obj_in_data)  # type: ignore[call-arg]
-        db.add(db_obj)
-        await db.flush()
-        await db.refresh(db_obj)
+        """
+        Creates a record and returns the stored row in one `INSERT ... RETURNING`.
+        """
+        (db_obj,) = await self.create_many(db, objs_in=[obj_in])
         return db_obj
 
+    async def create_many(
+        self, db: AsyncSession, *, objs_in: Sequence[CreateSchemaType]
+    ) -> Sequence[ModelType]:
+        """
+        Creates all `objs_in` with a single multi-row `INSERT ... RETURNING`.
+
+        **Parameters**
+
+        * `session`: The SQLAlchemy session object
+        * `objs_in`: Pydantic schemas of the records to create
+        """
+        if not objs_in:
+            return []
+
+        result = await db.scalars(
+            insert(self.model).returning(self.model, sort_by_parameter_order=True),
+            [self._get_insert_values(obj_in) for obj_in in objs_in],
+        )
+        return result.all()
+
+    def _get_insert_values(self, obj_in: CreateSchemaType) -> dict[str, Any]:
+        # Build the model to apply its defaults (id, timestamps), but leave out
+        # generated columns, which are filled in by the database
+        db_obj = self.model(**obj_in.model_dump())  # type: ignore[call-arg]
+        return {
+            column.key: getattr(db_obj, column.key)
+            for column in self._table.columns
+            if column.computed is None
+        }
+
     async def update(
         self,
         db: AsyncSession,
         *,
         db_obj: ModelType,
         obj_in: UpdateSchemaType | dict[str, Any],
-        skip_refresh: bool = False,
     ) -> ModelType:
-        if isinstance(obj_in, dict):
-            update_data = obj_in
-        else:
-            update_data = obj_in.model_dump(exclude_unset=True)
+        """
+        Updates `db_obj` and reloads it from the same `UPDATE ... RETURNING`.
+
+        `updated_at` is set by the database in the same statement. Raises a 404
+        if the record was deleted since `db_obj` was loaded.
+        """
+        updated = await self.update_many(db, ids=[db_obj.id], obj_in=obj_in)
+        if not updated:
+            raise HTTPException(
+                status_code=status.HTTP_404_NOT_FOUND,
+                detail=f"{self.model.__name__} not found",
+            )
+        return updated[0]
+
+    async def update_many(
+        self,
+        db: AsyncSession,
+        *,
+        ids: Sequence[Any],
+        obj_in: UpdateSchemaType | dict[str, Any],
+        where: Sequence[ColumnElement[bool]] = (),
+    ) -> Sequence[ModelType]:
+        """
+        Applies the same change to all `ids` with a single `UPDATE ... RETURNING`.
+
+        Rows that do not match every clause in `where` are left untouched and
+        are not returned. Objects already loaded in the session are refreshed
+        with the returned values.
+
+        **Parameters**
 
-        db_obj.sqlmodel_update(update_data)
+        * `session`: The SQLAlchemy session object
+        * `ids`: Primary keys of the records to update
+        * `obj_in`: The change to apply, as a schema (unset fields are skipped) or dict
+        * `where`: Extra conditions each row must satisfy, e.g. ownership checks
+        """
+        if not ids:
+            return []
 
-        db.add(db_obj)
-        await db.flush()
-        if not skip_refresh:
-            await db.refresh(db_obj)
+        if isinstance(obj_in, dict):
+            update_data = dict(obj_in)
         else:
-            # manually set the updated_on field
-            db_obj.updated_on = datetime.datetime.now(ZoneInfo("UTC"))
+            update_data = obj_in.model_dump(exclude_unset=True)
+        update_data["updated_at"] = _utc_now()
+        if self.uses_soft_delete:
+            where = [*where, col(self.model.deleted_at).is_(None)]  # type: ignore[attr-defined]
+        query = (
+            update(self.model)
+            .where(col(self.model.id).in_(ids), *where)
+            .values(**update_data)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        result = await db.scalars(query)
+        return result.all()
+
+    async def remove(self, db: AsyncSession, *, id: Any) -> ModelType | None:
+        """
+        Deletes a record and returns it, or None if it does not exist.
 
-        return db_obj
+        `SoftDeleteBase` records are only marked as deleted, in a single
+        `UPDATE ... RETURNING`; `purge_deleted` removes them physically later.
+        """
+        if self.uses_soft_delete:
+            result = await db.scalars(
+                self._get_soft_delete_statement(col(self.model.id) == id)
+            )
+            return result.first()
 
-    async def remove(self, db: AsyncSession, *, id: int) -> ModelType | None:
         obj = await db.get(self.model, id)
         if not obj:
             return None
@@ -177,6 +542,80 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         await db.delete(obj)
         return obj
 
+    async def restore(self, db: AsyncSession, *, id: Any) -> ModelType | None:
+        """
+        Undoes `remove` on a soft-deleted record that has not been purged yet.
+
+        Returns None if there is no soft-deleted record with this `id`.
+        """
+        deleted_at = col(self.model.deleted_at)  # type: ignore[attr-defined]
+        result = await db.scalars(
+            update(self.model)
+            .where(col(self.model.id) == id, deleted_at.isnot(None))
+            .values(deleted_at=None)
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+        return result.first()
+
+    def _get_soft_delete_statement(self, condition: ColumnElement[bool]) -> Any:
+        deleted_at = col(self.model.deleted_at)  # type: ignore[attr-defined]
+        return (
+            update(self.model)
+            .where(condition, deleted_at.is_(None))
+            .values(deleted_at=_utc_now())
+            .returning(self.model)
+            .execution_options(populate_existing=True)
+        )
+
+    async def purge_deleted(
+        self,
+        db: AsyncSession,
+        *,
+        deleted_before: datetime,
+        limit: int = 500,
+    ) -> int:
+        """
+        Physically deletes up to `limit` records soft-deleted before `deleted_before`.
+
+        Meant to be called in a loop, committing after each chunk, so every
+        transaction only locks and writes a bounded number of rows. Rows locked
+        by other transactions are skipped and picked up by a later chunk.
+        Returns the number of deleted rows.
+
+        Each of `_get_purge_conditions` is purged in its own pass, so every
+        chunk is found through an index instead of a scan over an `OR`.
+
+        **Parameters**
+
+        * `session`: The SQLAlchemy session object
+        * `deleted_before`: Only records deleted before this UTC time are purged
+        * `limit`: Maximum number of records deleted in this call
+        """
+        id_column = col(self.model.id)
+        purged = 0
+        for condition in self._get_purge_conditions(deleted_before):
+            chunk = (
+                select(id_column)
+                .where(condition)
+                .limit(limit - purged)
+                .with_for_update(skip_locked=True)
+            )
+            result = await db.execute(
+                delete(self.model)
+                .where(id_column.in_(chunk.scalar_subquery()))
+                .execution_options(synchronize_session=False)
+            )
+            purged += cast(CursorResult[Any], result).rowcount
+            if purged >= limit:
+                break
+        return purged
+
+    def _get_purge_conditions(
+        self, deleted_before: datetime
+    ) -> list[ColumnElement[bool]]:
+        return [col(self.model.deleted_at) < deleted_before]  # type: ignore[attr-defined]
+
     async def iterate(
         self,
         db: AsyncSession,
@@ -188,15 +627,26 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         """
         Yields `n` elements at a time from the table associated with `self.model`.
 
+        Batches are fetched with a keyset seek on `id`, so every batch costs the
+        same regardless of how far the scan has progressed. Once a batch has been
+        yielded, pending changes are flushed and its objects are expunged from the
+        session, keeping memory bounded on large tables.
+
         **Parameters**
 
         * `session`: The SQLAlchemy session object
         * `n`: The number of elements to yield at a time
-        continue: If False, the function will continue to yield elements until there are no more elements in the table
+        continue: If False, every batch restarts from the beginning of the table, for
+            callers that delete or update the yielded rows so they no longer match
         """
-        offset = 0
+        id_column = col(self.model.id)
+        last_id: uuid.UUID | None = None
         while True:
-            query = select(self.model).offset(offset).limit(n)
+            query = self._exclude_deleted(
+                select(self.model).order_by(id_column).limit(n)
+            )
+            if last_id is not None:
+                query = query.where(id_column > last_id)
 
             if filter_by:
                 for attr, value, is_not, greater_then_comp in filter_by:
@@ -215,8 +665,16 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
                 break
             for item in items:
                 yield item
+
+            await db.flush()
+            for item in items:
+                if item in db:
+                    db.expunge(item)
+
             if continues:
-                offset += n
+                if len(items) < n:
+                    break
+                last_id = items[-1].id
 
     async def get_count(
         self,
@@ -230,7 +688,7 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         * `session`: The SQLAlchemy session object
         """
-        query = select(func.count()).select_from(self.model)
+        query = self._exclude_deleted(select(func.count()).select_from(self.model))
         if filter_by:
             for attr, value, is_not, greater_then_comp in filter_by:
                 comparison = get_comparison(
@@ -243,3 +701,24 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
 
         result = await db.execute(query)
         return result.scalar() or 0
+
+    async def get_count_estimate(
+        self,
+        db: AsyncSession,
+        query: Select[Any],
+        params: dict[str, Any] | None = None,
+    ) -> int:
+        """
+        Returns the planner's row estimate for `query` without executing it.
+
+        Much cheaper than `COUNT(*)` on large or unindexed filters, but only as
+        accurate as the table statistics gathered by `ANALYZE`.
+
+        **Parameters**
+
+        * `session`: The SQLAlchemy session object
+        * `query`: The filtered `SELECT` to estimate
+        * `params`: Values for the bind parameters of `query`
+        """
+        result = await db.execute(Explain(query), params)
+        return get_plan_rows(result.scalar())
@@ -0,0 +1,69 @@
+import uuid
+from datetime import datetime
+from typing import Any, Literal, cast
+
+from sqlalchemy import CursorResult, Row, bindparam, delete, exists, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlmodel import col
+
+from app.models.collection_version import CollectionVersion
+from app.models.project import Project
+from app.models.user import User
+
+CollectionScope = Literal["projects", "tasks"]
+
+# The table whose rows key each scope: a user's projects, a project's tasks
+_OWNER_IDS = {"projects": col(User.id), "tasks": col(Project.id)}
+
+# Selects columns rather than the entity, so a version read twice in one
+# session is never served stale from the identity map
+_GET_VERSION = select(
+    col(CollectionVersion.version), col(CollectionVersion.updated_at)
+).where(
+    col(CollectionVersion.scope) == bindparam("scope"),
+    col(CollectionVersion.key) == bindparam("key"),
+)
+
+
+async def get_collection_version(
+    db: AsyncSession, *, scope: CollectionScope, key: uuid.UUID
+) -> Row[tuple[int, datetime]] | None:
+    """
+    Returns `(version, updated_at)` of a user's projects (`scope="projects"`,
+    `key` the owner id) or of a project's tasks (`scope="tasks"`, `key` the
+    project id).
+
+    A single primary key lookup, cheap enough to run before deciding whether a
+    list query is needed at all. None if the collection has not changed since
+    versions were introduced.
+    """
+    result = await db.execute(_GET_VERSION, {"scope": scope, "key": key})
+    return result.first()
+
+
+async def purge_orphaned_versions(
+    db: AsyncSession, *, scope: CollectionScope, limit: int = 500
+) -> int:
+    """
+    Deletes up to `limit` versions of `scope` collections whose user or project
+    no longer exists, e.g. after a purge or a deleted account. Their DELETE
+    triggers even add such rows, one last bump per removed collection.
+
+    Soft-deleted projects keep their version, as they may still be restored.
+    Returns the number of deleted rows; like `CRUDBase.purge_deleted`, meant to
+    be called in a loop with one transaction per chunk.
+    """
+    key = col(CollectionVersion.key)
+    in_scope = col(CollectionVersion.scope) == scope
+    chunk = (
+        select(key)
+        .where(in_scope, ~exists().where(_OWNER_IDS[scope] == key))
+        .limit(limit)
+        .with_for_update(skip_locked=True)
+    )
+    result = await db.execute(
+        delete(CollectionVersion)
+        .where(in_scope, key.in_(chunk.scalar_subquery()))
+        .execution_options(synchronize_session=False)
+    )
+    return cast(CursorResult[Any], result).rowcount
@@ -0,0 +1,80 @@
+import asyncio
+from collections.abc import Iterable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase, ModelType
+
+
+class BatchLoader:
+    """
+    Loads rows by id, coalescing the lookups made in the same event loop tick.
+
+    Lookups that are awaited together, e.g. through `asyncio.gather` or
+    `load_many()`, become a single `get_by_ids()` query per model instead of one
+    query each. Results are not kept beyond the batch; repeated loads hit the
+    database again but return the session's identity-mapped objects.
+
+    Use `get_loader()` to get the loader of a session, which lives as long as
+    the request.
+    """
+
+    def __init__(self, session: AsyncSession):
+        self.session = session
+        self._pending: dict[
+            CRUDBase[Any, Any, Any], dict[Any, asyncio.Future[Any]]
+        ] = {}
+        # An AsyncSession runs one query at a time
+        self._lock = asyncio.Lock()
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(
+        self, crud: CRUDBase[ModelType, Any, Any], id: Any
+    ) -> asyncio.Future[ModelType | None]:
+        """
+        Returns a future for the row of `crud.model` with `id`, None if missing.
+
+        Like `CRUDBase.get`, soft-deleted rows count as missing.
+        """
+        loop = asyncio.get_running_loop()
+        if not self._pending:
+            # Runs after the tasks that are already scheduled for this tick
+            task = loop.create_task(self._dispatch())
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+        futures = self._pending.setdefault(crud, {})
+        future = futures.get(id)
+        if future is None:
+            future = futures[id] = loop.create_future()
+        return future
+
+    async def load_many(
+        self, crud: CRUDBase[ModelType, Any, Any], ids: Iterable[Any]
+    ) -> list[ModelType | None]:
+        """Loads several rows with one query, in the order of `ids`."""
+        return list(await asyncio.gather(*(self.load(crud, id) for id in ids)))
+
+    async def _dispatch(self) -> None:
+        async with self._lock:
+            batches, self._pending = self._pending, {}
+            for crud, futures in batches.items():
+                try:
+                    rows = await crud.get_by_ids(self.session, ids=futures.keys())
+                except Exception as e:
+                    for future in futures.values():
+                        if not future.done():
+                            future.set_exception(e)
+                    continue
+                found = {row.id: row for row in rows}
+                for id, future in futures.items():
+                    if not future.done():
+                        future.set_result(found.get(id))
+
+
+def get_loader(session: AsyncSession) -> BatchLoader:
+    """Returns the `BatchLoader` of `session`, creating it on first use."""
+    loader = session.info.get("batch_loader")
+    if loader is None:
+        loader = session.info["batch_loader"] = BatchLoader(session)
+    return loader  # type: ignore[no-any-return]
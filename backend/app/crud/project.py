@@ -1,21 +1,36 @@
 import uuid
-from collections.abc import Sequence
-from typing import Literal
+from collections.abc import Collection, Sequence
+from typing import Any, Literal, overload
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import Row, Select, String, bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, SortDirection
+from app.logic.utils.db_utils import (
+    TRIGRAM_MIN_LENGTH,
+    get_prefix_condition,
+    get_search_query,
+)
 from app.models.project import Project
 from app.schemas.project import ProjectCreate, ProjectUpdate
 
-ProjectSortField = Literal["name", "status", "created_at", "updated_at"]
-SortDirection = Literal["asc", "desc"]
+ProjectSortField = Literal["name", "status", "created_at", "updated_at", "relevance"]
+
+SORT_COLUMNS: dict[str, Any] = {
+    "name": col(Project.name),
+    "status": col(Project.status),
+    "created_at": col(Project.created_at),
+    "updated_at": col(Project.updated_at),
+}
 
 
 class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
-    async def get_multi_filtered(
+    list_deferred = ("search_vector",)
+
+    # These overloads let the type checker tell model instances from `Row`s
+    @overload
+    async def get_multi_filtered(  # noqa: E704
         self,
         db: AsyncSession,
         *,
@@ -26,39 +41,96 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         owner_id: uuid.UUID | None = None,
         sort_by: ProjectSortField = "created_at",
         sort_dir: SortDirection = "desc",
-    ) -> Sequence[Project]:
-        query = select(Project)
-
-        if search:
-            like = f"%{search.strip()}%"
-            query = query.where(
-                or_(
-                    col(Project.name).ilike(like),
-                    col(Project.description).ilike(like),
-                )
-            )
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: Literal[False] = False,
+    ) -> Sequence[Project]: ...
 
-        if status:
-            query = query.where(col(Project.status) == status)
-
-        if owner_id:
-            query = query.where(col(Project.owner_id) == owner_id)
-
-        sort_column = {
-            "name": col(Project.name),
-            "status": col(Project.status),
-            "created_at": col(Project.created_at),
-            "updated_at": col(Project.updated_at),
-        }.get(sort_by, col(Project.created_at))
+    @overload
+    async def get_multi_filtered(  # noqa: E704
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        search: str | None = None,
+        status: str | None = None,
+        owner_id: uuid.UUID | None = None,
+        sort_by: ProjectSortField = "created_at",
+        sort_dir: SortDirection = "desc",
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: Literal[True],
+    ) -> Sequence[Row[Any]]: ...
 
-        if sort_dir == "asc":
-            query = query.order_by(sort_column.asc())
+    async def get_multi_filtered(
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        search: str | None = None,
+        status: str | None = None,
+        owner_id: uuid.UUID | None = None,
+        sort_by: ProjectSortField = "created_at",
+        sort_dir: SortDirection = "desc",
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: bool = False,
+    ) -> Sequence[Project] | Sequence[Row[Any]]:
+        """
+        Returns one page of filtered, sorted rows.
+
+        `fields` limits the loaded columns to a sparse selection, see
+        `_get_list_load_options`. With `rows` the page is returned as `Row`
+        tuples instead of model instances, see `_execute_list`.
+        """
+        params = self._get_filter_params(
+            search=search, status=status, owner_id=owner_id
+        )
+        if cursor:
+            params.update(
+                self.get_cursor_params(cursor, sort_by=sort_by, sort_dir=sort_dir)
+            )
         else:
-            query = query.order_by(sort_column.desc())
+            params["skip"] = skip
+        params["limit"] = limit
+
+        shape = frozenset(params)
+        load = frozenset(fields) if fields is not None else None
+        query = self._get_statement(
+            ("get_multi_filtered", sort_by, sort_dir, shape, load, rows),
+            lambda: self._build_multi_filtered(
+                shape, sort_by=sort_by, sort_dir=sort_dir, fields=load, rows=rows
+            ),
+        )
+        return await self._execute_list(db, query, params, rows=rows)
+
+    def _build_multi_filtered(
+        self,
+        shape: frozenset[str],
+        *,
+        sort_by: ProjectSortField,
+        sort_dir: SortDirection,
+        fields: frozenset[str] | None = None,
+        rows: bool = False,
+    ) -> Select[Any]:
+        query = self._select_list(fields, sort_by=sort_by, rows=rows)
+        query = self._apply_filters(query, shape)
+
+        sort_column = SORT_COLUMNS.get(sort_by, col(Project.created_at))
+        if sort_by == "relevance" and "search" in shape:
+            sort_column = func.ts_rank(
+                col(Project.search_vector),
+                get_search_query(bindparam("search", type_=String)),
+            )
+        query = self._apply_order(
+            query, sort_column=sort_column, sort_dir=sort_dir, params=shape
+        )
 
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        if "skip" in shape:
+            query = query.offset(bindparam("skip"))
+        return query.limit(bindparam("limit"))
 
     async def get_count_filtered(
         self,
@@ -67,26 +139,91 @@ class CRUDProject(CRUDBase[Project, ProjectCreate, ProjectUpdate]):
         search: str | None = None,
         status: str | None = None,
         owner_id: uuid.UUID | None = None,
+        estimate: bool = False,
     ) -> int:
-        query = select(func.count()).select_from(Project)
+        params = self._get_filter_params(
+            search=search, status=status, owner_id=owner_id
+        )
+        shape = frozenset(params)
+        if estimate:
+            query = self._get_statement(
+                ("get_count_filtered", "estimate", shape),
+                lambda: self._apply_filters(select(Project), shape),
+            )
+            return await self.get_count_estimate(db, query, params)
+
+        query = self._get_statement(
+            ("get_count_filtered", shape),
+            lambda: self._apply_filters(
+                select(func.count()).select_from(Project), shape
+            ),
+        )
+        result = await db.execute(query, params)
+        return result.scalar() or 0
 
-        if search:
-            like = f"%{search.strip()}%"
+    async def suggest(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        owner_id: uuid.UUID,
+        limit: int = 10,
+    ) -> Sequence[Row[tuple[uuid.UUID, str]]]:
+        """Return `(id, name)` of the owner's projects best matching `query`.
+
+        The substring match is served by the `pg_trgm` GIN index on `name`.
+        Queries shorter than a trigram match name prefixes instead, served by
+        `ix_projects_owner_id_lower_name`.
+        """
+        stmt = select(col(Project.id), col(Project.name)).where(
+            col(Project.owner_id) == owner_id
+        )
+        if len(query) < TRIGRAM_MIN_LENGTH:
+            lower_name = func.lower(col(Project.name))
+            stmt = stmt.where(get_prefix_condition(lower_name, query.lower()))
+            stmt = stmt.order_by(lower_name, col(Project.id))
+        else:
+            stmt = stmt.where(
+                col(Project.name).icontains(query, autoescape=True)
+            ).order_by(func.similarity(col(Project.name), query).desc())
+        stmt = stmt.limit(limit)
+        stmt = self._exclude_deleted(stmt)
+        result = await db.execute(stmt)
+        return result.all()
+
+    def _get_filter_params(
+        self,
+        *,
+        search: str | None,
+        status: str | None,
+        owner_id: uuid.UUID | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if search and search.strip():
+            params["search"] = search.strip()
+        if status:
+            params["status"] = status
+        if owner_id:
+            params["owner_id"] = owner_id
+        return params
+
+    def _apply_filters(self, query: Select[Any], shape: Collection[str]) -> Select[Any]:
+        # Adds a filter bound to a parameter of the same name for each key in `shape`
+        query = self._exclude_deleted(query)
+        if "search" in shape:
             query = query.where(
-                or_(
-                    col(Project.name).ilike(like),
-                    col(Project.description).ilike(like),
+                col(Project.search_vector).bool_op("@@")(
+                    get_search_query(bindparam("search", type_=String))
                 )
             )
 
-        if status:
-            query = query.where(col(Project.status) == status)
+        if "status" in shape:
+            query = query.where(col(Project.status) == bindparam("status"))
 
-        if owner_id:
-            query = query.where(col(Project.owner_id) == owner_id)
+        if "owner_id" in shape:
+            query = query.where(col(Project.owner_id) == bindparam("owner_id"))
 
-        result = await db.execute(query)
-        return result.scalar() or 0
+        return query
 
 
 project = CRUDProject(Project)
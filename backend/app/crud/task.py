@@ -1,22 +1,82 @@
 import uuid
-from collections.abc import Sequence
-from typing import Literal
+from collections.abc import Collection, Sequence
+from datetime import datetime
+from typing import Any, Literal, overload
 
-from sqlalchemy import func, or_, select
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    String,
+    bindparam,
+    func,
+    select,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
 
-from app.crud.base import CRUDBase
+from app.crud.base import CRUDBase, SortDirection
+from app.logic.utils.db_utils import (
+    TRIGRAM_MIN_LENGTH,
+    get_prefix_condition,
+    get_search_query,
+)
+from app.models.project import Project
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate
 
 TaskSortField = Literal[
-    "title", "status", "priority", "due_date", "created_at", "updated_at"
+    "title", "status", "priority", "due_date", "created_at", "updated_at", "relevance"
 ]
-SortDirection = Literal["asc", "desc"]
+
+SORT_COLUMNS: dict[str, Any] = {
+    "title": col(Task.title),
+    "status": col(Task.status),
+    "priority": col(Task.priority),
+    "due_date": col(Task.due_date),
+    "created_at": col(Task.created_at),
+    "updated_at": col(Task.updated_at),
+}
 
 
 class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
+    list_deferred = ("search_vector",)
+
+    # These overloads let the type checker tell model instances from `Row`s
+    @overload
+    async def get_multi_filtered(  # noqa: E704
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        search: str | None = None,
+        status: str | None = None,
+        project_id: uuid.UUID | None = None,
+        sort_by: TaskSortField = "created_at",
+        sort_dir: SortDirection = "desc",
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: Literal[False] = False,
+    ) -> Sequence[Task]: ...
+
+    @overload
+    async def get_multi_filtered(  # noqa: E704
+        self,
+        db: AsyncSession,
+        *,
+        skip: int = 0,
+        limit: int = 50,
+        search: str | None = None,
+        status: str | None = None,
+        project_id: uuid.UUID | None = None,
+        sort_by: TaskSortField = "created_at",
+        sort_dir: SortDirection = "desc",
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: Literal[True],
+    ) -> Sequence[Row[Any]]: ...
+
     async def get_multi_filtered(
         self,
         db: AsyncSession,
@@ -28,41 +88,63 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         project_id: uuid.UUID | None = None,
         sort_by: TaskSortField = "created_at",
         sort_dir: SortDirection = "desc",
-    ) -> Sequence[Task]:
-        query = select(Task)
+        cursor: str | None = None,
+        fields: Collection[str] | None = None,
+        rows: bool = False,
+    ) -> Sequence[Task] | Sequence[Row[Any]]:
+        """
+        Returns one page of filtered, sorted rows.
 
-        if search:
-            like = f"%{search.strip()}%"
-            query = query.where(
-                or_(
-                    col(Task.title).ilike(like),
-                    col(Task.description).ilike(like),
-                )
+        `fields` limits the loaded columns to a sparse selection, see
+        `_get_list_load_options`. With `rows` the page is returned as `Row`
+        tuples instead of model instances, see `_execute_list`.
+        """
+        params = self._get_filter_params(
+            search=search, status=status, project_id=project_id
+        )
+        if cursor:
+            params.update(
+                self.get_cursor_params(cursor, sort_by=sort_by, sort_dir=sort_dir)
             )
+        else:
+            params["skip"] = skip
+        params["limit"] = limit
 
-        if status:
-            query = query.where(col(Task.status) == status)
+        shape = frozenset(params)
+        load = frozenset(fields) if fields is not None else None
+        query = self._get_statement(
+            ("get_multi_filtered", sort_by, sort_dir, shape, load, rows),
+            lambda: self._build_multi_filtered(
+                shape, sort_by=sort_by, sort_dir=sort_dir, fields=load, rows=rows
+            ),
+        )
+        return await self._execute_list(db, query, params, rows=rows)
 
-        if project_id:
-            query = query.where(col(Task.project_id) == project_id)
-
-        sort_column = {
-            "title": col(Task.title),
-            "status": col(Task.status),
-            "priority": col(Task.priority),
-            "due_date": col(Task.due_date),
-            "created_at": col(Task.created_at),
-            "updated_at": col(Task.updated_at),
-        }.get(sort_by, col(Task.created_at))
-
-        if sort_dir == "asc":
-            query = query.order_by(sort_column.asc())
-        else:
-            query = query.order_by(sort_column.desc())
+    def _build_multi_filtered(
+        self,
+        shape: frozenset[str],
+        *,
+        sort_by: TaskSortField,
+        sort_dir: SortDirection,
+        fields: frozenset[str] | None = None,
+        rows: bool = False,
+    ) -> Select[Any]:
+        query = self._select_list(fields, sort_by=sort_by, rows=rows)
+        query = self._apply_filters(query, shape)
+
+        sort_column = SORT_COLUMNS.get(sort_by, col(Task.created_at))
+        if sort_by == "relevance" and "search" in shape:
+            sort_column = func.ts_rank(
+                col(Task.search_vector),
+                get_search_query(bindparam("search", type_=String)),
+            )
+        query = self._apply_order(
+            query, sort_column=sort_column, sort_dir=sort_dir, params=shape
+        )
 
-        query = query.offset(skip).limit(limit)
-        result = await db.execute(query)
-        return result.scalars().all()
+        if "skip" in shape:
+            query = query.offset(bindparam("skip"))
+        return query.limit(bindparam("limit"))
 
     async def get_count_filtered(
         self,
@@ -71,26 +153,120 @@ class CRUDTask(CRUDBase[Task, TaskCreate, TaskUpdate]):
         search: str | None = None,
         status: str | None = None,
         project_id: uuid.UUID | None = None,
+        estimate: bool = False,
     ) -> int:
-        query = select(func.count()).select_from(Task)
+        params = self._get_filter_params(
+            search=search, status=status, project_id=project_id
+        )
+        shape = frozenset(params)
+        if estimate:
+            query = self._get_statement(
+                ("get_count_filtered", "estimate", shape),
+                lambda: self._apply_filters(select(Task), shape),
+            )
+            return await self.get_count_estimate(db, query, params)
+
+        query = self._get_statement(
+            ("get_count_filtered", shape),
+            lambda: self._apply_filters(select(func.count()).select_from(Task), shape),
+        )
+        result = await db.execute(query, params)
+        return result.scalar() or 0
 
-        if search:
-            like = f"%{search.strip()}%"
+    async def suggest(
+        self,
+        db: AsyncSession,
+        *,
+        query: str,
+        owner_id: uuid.UUID,
+        project_id: uuid.UUID | None = None,
+        limit: int = 10,
+    ) -> Sequence[Row[tuple[uuid.UUID, str]]]:
+        """Return `(id, title)` of tasks in the owner's projects best matching `query`.
+
+        The substring match is served by the `pg_trgm` GIN index on `title`.
+        Queries shorter than a trigram match title prefixes instead, served per
+        project by `ix_tasks_project_id_lower_title`.
+        """
+        stmt = (
+            select(col(Task.id), col(Task.title))
+            .join(Project, col(Project.id) == col(Task.project_id))
+            .where(
+                col(Project.owner_id) == owner_id,
+                col(Project.deleted_at).is_(None),
+            )
+        )
+        if len(query) < TRIGRAM_MIN_LENGTH:
+            lower_title = func.lower(col(Task.title))
+            stmt = stmt.where(get_prefix_condition(lower_title, query.lower()))
+            stmt = stmt.order_by(lower_title, col(Task.id))
+        else:
+            stmt = stmt.where(
+                col(Task.title).icontains(query, autoescape=True)
+            ).order_by(func.similarity(col(Task.title), query).desc())
+        stmt = stmt.limit(limit)
+        if project_id:
+            stmt = stmt.where(col(Task.project_id) == project_id)
+
+        stmt = self._exclude_deleted(stmt)
+        result = await db.execute(stmt)
+        return result.all()
+
+    def _get_filter_params(
+        self,
+        *,
+        search: str | None,
+        status: str | None,
+        project_id: uuid.UUID | None,
+    ) -> dict[str, Any]:
+        params: dict[str, Any] = {}
+        if search and search.strip():
+            params["search"] = search.strip()
+        if status:
+            params["status"] = status
+        if project_id:
+            params["project_id"] = project_id
+        return params
+
+    def _apply_filters(self, query: Select[Any], shape: Collection[str]) -> Select[Any]:
+        # Adds a filter bound to a parameter of the same name for each key in `shape`
+        query = self._exclude_deleted(query)
+        if "search" in shape:
             query = query.where(
-                or_(
-                    col(Task.title).ilike(like),
-                    col(Task.description).ilike(like),
+                col(Task.search_vector).bool_op("@@")(
+                    get_search_query(bindparam("search", type_=String))
                 )
             )
 
-        if status:
-            query = query.where(col(Task.status) == status)
+        if "status" in shape:
+            query = query.where(col(Task.status) == bindparam("status"))
 
-        if project_id:
-            query = query.where(col(Task.project_id) == project_id)
+        if "project_id" in shape:
+            query = query.where(col(Task.project_id) == bindparam("project_id"))
+        else:
+            # Deleting a project only marks the project row, so unscoped queries
+            # have to hide the tasks of deleted projects themselves
+            live_projects = select(col(Project.id)).where(
+                col(Project.deleted_at).is_(None)
+            )
+            query = query.where(col(Task.project_id).in_(live_projects))
 
-        result = await db.execute(query)
-        return result.scalar() or 0
+        return query
+
+    def _get_purge_conditions(
+        self, deleted_before: datetime
+    ) -> list[ColumnElement[bool]]:
+        # Purge the tasks of deleted projects too, in chunks, instead of leaving
+        # them to a single large ON DELETE CASCADE. A separate pass, found
+        # through ix_tasks_project_id_created_at, as an OR of both conditions
+        # could use neither index.
+        deleted_projects = select(col(Project.id)).where(
+            col(Project.deleted_at) < deleted_before
+        )
+        return [
+            *super()._get_purge_conditions(deleted_before),
+            col(Task.project_id).in_(deleted_projects),
+        ]
 
 
 task = CRUDTask(Task)
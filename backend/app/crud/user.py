@@ -1,4 +1,6 @@
-from sqlalchemy import select
+from fastapi import HTTPException, status
+from sqlalchemy import bindparam, select
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlmodel import col
 
@@ -11,9 +13,41 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     async def get_by_auth0_sub(
         self, db: AsyncSession, *, auth0_sub: str
     ) -> User | None:
-        result = await db.execute(select(User).where(col(User.auth0_sub) == auth0_sub))
+        query = self._get_statement(
+            "get_by_auth0_sub",
+            lambda: select(User).where(col(User.auth0_sub) == bindparam("auth0_sub")),
+        )
+        result = await db.execute(query, {"auth0_sub": auth0_sub})
         return result.scalars().first()
 
+    async def get_or_create_by_auth0_sub(
+        self, db: AsyncSession, *, obj_in: UserCreate
+    ) -> tuple[User, bool]:
+        """Return the user for `obj_in.auth0_sub`, creating it if it does not exist.
+
+        Uses `INSERT ... ON CONFLICT DO NOTHING RETURNING`, so concurrent first
+        logins never fail on the unique constraint. The boolean is True only for
+        the caller whose insert created the user.
+        """
+        stmt = (
+            insert(User)
+            .values(**self._get_insert_values(obj_in))
+            .on_conflict_do_nothing(index_elements=[col(User.auth0_sub)])
+            .returning(User)
+        )
+        created = (await db.scalars(stmt)).first()
+        if created:
+            return created, True
+
+        existing = await self.get_by_auth0_sub(db, auth0_sub=obj_in.auth0_sub)
+        if not existing:
+            # The conflicting row was deleted before we could read it
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="User changed concurrently, please retry",
+            )
+        return existing, False
+
     async def get_by_email(self, db: AsyncSession, *, email: str) -> User | None:
         result = await db.execute(select(User).where(col(User.email) == email))
         return result.scalars().first()
@@ -1,7 +1,29 @@
+import base64
+import binascii
+import json
 from typing import Any, Literal
 
-from sqlalchemy import BinaryExpression, ColumnElement
+from sqlalchemy import (
+    BinaryExpression,
+    ClauseElement,
+    ColumnElement,
+    and_,
+    or_,
+    tuple_,
+)
+from sqlalchemy.dialects.postgresql.ext import websearch_to_tsquery
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import InstrumentedAttribute
+from sqlalchemy.sql.compiler import SQLCompiler
+from sqlalchemy.sql.expression import Executable
+
+# Text search configuration used by the generated `search_vector` columns.
+# "simple" skips stemming and stop words, so short terms like "A" still match.
+TEXT_SEARCH_CONFIG = "simple"
+
+# pg_trgm indexes only serve patterns with at least one full trigram; shorter
+# typeahead input is matched as a prefix instead, see `get_prefix_condition`
+TRIGRAM_MIN_LENGTH = 3
 
 
 def get_comparison(
@@ -20,3 +42,112 @@ def get_comparison(
                 return attr.__le__(value) if not is_not else attr.__gt__(value)
         else:
             return attr.__eq__(value) if not is_not else attr.__ne__(value)
+
+
+def get_search_query(search: str | ColumnElement[str]) -> websearch_to_tsquery:
+    """Parse user input with web-search syntax (quotes, `or`, `-term`) into a tsquery.
+
+    `search` may also be a bind parameter, for statements cached by shape.
+    """
+    if isinstance(search, str):
+        search = search.strip()
+    return websearch_to_tsquery(TEXT_SEARCH_CONFIG, search)
+
+
+def get_prefix_condition(expr: ColumnElement[str], prefix: str) -> ColumnElement[bool]:
+    """`expr` starts with `prefix`, as the range `[prefix, next prefix)`.
+
+    Uses the `text_pattern_ops` operators, so a btree index over `expr` with
+    that operator class serves it, also in generic plans where a
+    `LIKE :prefix || '%'` pattern is unknown and cannot be turned into a range.
+    """
+    condition = expr.op("~>=~")(prefix)
+    last = ord(prefix[-1]) + 1
+    if last == 0xD800:  # surrogates cannot be encoded, skip past them
+        last = 0xE000
+    if last > 0x10FFFF:
+        return condition
+    return and_(condition, expr.op("~<~")(prefix[:-1] + chr(last)))
+
+
+class Explain(Executable, ClauseElement):
+    """`EXPLAIN (FORMAT JSON)` wrapper that keeps the statement's bound parameters."""
+
+    inherit_cache = False
+
+    def __init__(self, statement: ClauseElement):
+        self.statement = statement
+
+
+@compiles(Explain, "postgresql")
+def _compile_explain(element: Explain, compiler: SQLCompiler, **kw: Any) -> str:  # pyright: ignore[reportUnusedFunction]
+    return "EXPLAIN (FORMAT JSON) " + compiler.process(element.statement, **kw)
+
+
+def get_plan_rows(plan: Any) -> int:
+    """Extract the planner's row estimate from `EXPLAIN (FORMAT JSON)` output."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return int(plan[0]["Plan"]["Plan Rows"])
+
+
+def encode_cursor(payload: dict[str, Any]) -> str:
+    """Encode a JSON-serializable payload as an opaque, URL-safe cursor."""
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).rstrip(b"=").decode()
+
+
+def decode_cursor(cursor: str) -> dict[str, Any] | None:
+    """Decode a cursor produced by `encode_cursor`, returning None if malformed."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (binascii.Error, ValueError):
+        return None
+    return payload if isinstance(payload, dict) else None  # type: ignore[return-value]
+
+
+def get_keyset_condition(
+    sort_attr: InstrumentedAttribute[Any] | ColumnElement[Any],
+    id_attr: InstrumentedAttribute[Any],
+    sort_value: Any,
+    last_id: Any,
+    sort_dir: Literal["asc", "desc"],
+) -> ColumnElement[bool]:
+    """Build the WHERE clause that seeks past `(sort_value, last_id)`.
+
+    NOT NULL sort columns get a row-value comparison, `(sort, id) > (:v, :id)`,
+    which the planner uses as an Index Cond on the `(scope, sort, id)` indexes,
+    so deep pages start where the previous one ended instead of filtering from
+    the start of the index. Nullable columns need the OR form, matching
+    PostgreSQL's default NULL placement: NULLS LAST for ascending and NULLS
+    FIRST for descending order.
+    """
+    if not is_nullable(sort_attr):
+        columns, values = tuple_(sort_attr, id_attr), tuple_(sort_value, last_id)
+        return columns > values if sort_dir == "asc" else columns < values
+
+    if sort_dir == "asc":
+        if sort_value is None:
+            return and_(sort_attr.is_(None), id_attr > last_id)
+        return or_(
+            sort_attr > sort_value,
+            and_(sort_attr == sort_value, id_attr > last_id),
+            sort_attr.is_(None),
+        )
+
+    if sort_value is None:
+        return or_(
+            and_(sort_attr.is_(None), id_attr < last_id),
+            sort_attr.isnot(None),
+        )
+    return or_(
+        sort_attr < sort_value,
+        and_(sort_attr == sort_value, id_attr < last_id),
+    )
+
+
+def is_nullable(expr: InstrumentedAttribute[Any] | ColumnElement[Any]) -> bool:
+    """Whether `expr` may be NULL; True for anything but a NOT NULL column."""
+    column = getattr(expr, "expression", expr)
+    return bool(getattr(column, "nullable", True))
@@ -19,6 +19,7 @@ from app.core.errors import (
 )
 from app.core.logger import get_logger
 from app.core.middleware import RequestLoggingMiddleware
+from app.core.responses import FastJSONResponse
 
 # Configure logging levels for various loggers
 logger = get_logger("main")
@@ -77,6 +78,7 @@ app = FastAPI(
     title=settings.PROJECT_NAME,
     openapi_url=f"{settings.API_V1_STR}/openapi.json",
     generate_unique_id_function=custom_generate_unique_id,
+    default_response_class=FastJSONResponse,
 )
 
 app.openapi = custom_openapi  # type: ignore[assignment]
@@ -98,6 +100,8 @@ if settings.all_cors_origins:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        # Lets the frontend read validators for conditional requests
+        expose_headers=["ETag", "Last-Modified"],
     )
 
 ERROR_RESPONSES_TYPED: dict[int | str, dict[str, Any]] = ERROR_RESPONSES  # type: ignore[assignment]
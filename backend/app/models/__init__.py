@@ -6,7 +6,11 @@ This module provides the base SQLModel class and imports for database models.
 
 from sqlmodel import SQLModel
 
-from .base import Base  # Import the Base model for common fields and functionality
+from .base import (  # Import the base models for common fields and functionality
+    Base,
+    SoftDeleteBase,
+)
+from .collection_version import CollectionVersion
 from .project import Project
 from .task import Task
 from .user import User
@@ -20,6 +24,8 @@ from .user import User
 __all__ = [
     "SQLModel",
     "Base",
+    "SoftDeleteBase",
+    "CollectionVersion",
     "Project",
     "Task",
     "User",
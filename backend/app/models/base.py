@@ -25,7 +25,6 @@ class Base(SQLModel, ABC):
         default_factory=uuid.uuid4,
         primary_key=True,
         description="Unique identifier for the record",
-        index=True,
     )
 
     created_at: datetime = Field(
@@ -48,23 +47,26 @@ class Base(SQLModel, ABC):
 
 # Alternative base class with soft delete functionality
 class SoftDeleteBase(Base):
-    """Base model with soft delete functionality."""
+    """Base model with soft delete functionality.
+
+    Soft-deleted rows are hidden from the `CRUDBase` read paths and physically
+    removed later by the purge job (`app/scripts/purge_deleted.py`).
+    """
 
     deleted_at: datetime | None = Field(
         default=None,
         description="When this record was deleted (null if not deleted, UTC)",
     )
 
-    is_deleted: bool = Field(
-        default=False, description="Whether this record has been soft deleted"
-    )
+    @property
+    def is_deleted(self) -> bool:
+        """Whether this record has been soft deleted."""
+        return self.deleted_at is not None
 
     def soft_delete(self) -> None:
         """Mark this record as deleted."""
-        self.is_deleted = True
         self.deleted_at = datetime.now(timezone.utc).replace(tzinfo=None)
 
     def restore(self) -> None:
         """Restore a soft-deleted record."""
-        self.is_deleted = False
         self.deleted_at = None
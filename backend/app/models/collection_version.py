@@ -0,0 +1,30 @@
+import uuid
+from datetime import datetime
+
+import sqlalchemy as sa
+from sqlmodel import Field, SQLModel
+
+
+class CollectionVersion(SQLModel, table=True):
+    """Change counter of a collection that list endpoints serve, e.g. a user's
+    projects or a project's tasks.
+
+    Rows are only written by the statement-level triggers on `projects` and
+    `tasks` (migration 20261017_0008), which bump `version` and `updated_at`
+    whenever a statement touches the collection. A missing row means the
+    collection has not changed since the migration. The purge job removes the
+    rows of collections whose user or project no longer exists.
+    """
+
+    __tablename__ = "collection_versions"  # type: ignore[assignment]
+
+    # "projects" (keyed by owner_id) or "tasks" (keyed by project_id)
+    scope: str = Field(sa_column=sa.Column(sa.String, primary_key=True))
+    key: uuid.UUID = Field(sa_column=sa.Column(sa.Uuid, primary_key=True))
+    version: int = Field(
+        sa_column=sa.Column(sa.BigInteger, nullable=False),
+        description="Number of statements that changed the collection",
+    )
+    updated_at: datetime = Field(
+        description="When the collection last changed (UTC)",
+    )
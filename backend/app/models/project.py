@@ -2,17 +2,75 @@ import uuid
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship
 
-from app.models.base import Base
+from app.models.base import SoftDeleteBase
 
 if TYPE_CHECKING:
     from app.models.task import Task
     from app.models.user import User
 
 
-class Project(Base, table=True):
+class Project(SoftDeleteBase, table=True):
     __tablename__ = "projects"  # type: ignore[assignment]
+    __table_args__ = (
+        sa.Index("ix_projects_search_vector", "search_vector", postgresql_using="gin"),
+        sa.Index(
+            "ix_projects_name_trgm",
+            "name",
+            postgresql_using="gin",
+            postgresql_ops={"name": "gin_trgm_ops"},
+        ),
+        # Composite indexes matching the per-owner list queries: filter columns
+        # first, then the sort column and the `id` keyset tie-breaker. B-tree
+        # indexes scan backwards, so each one serves both sort directions.
+        # This one also covers soft-deleted rows, so ON DELETE CASCADE from
+        # `users` can use it; the others only index live rows.
+        sa.Index("ix_projects_owner_id_created_at", "owner_id", "created_at", "id"),
+        sa.Index(
+            "ix_projects_owner_id_updated_at",
+            "owner_id",
+            "updated_at",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_projects_owner_id_name",
+            "owner_id",
+            "name",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_projects_owner_id_status_created_at",
+            "owner_id",
+            "status",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_projects_owner_id_status",
+            "owner_id",
+            "status",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        # Prefix matches of typeahead input too short for the trigram index
+        sa.Index(
+            "ix_projects_owner_id_lower_name",
+            "owner_id",
+            sa.text("lower(name) text_pattern_ops"),
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        # Lets the purge job find soft-deleted rows without scanning live ones
+        sa.Index(
+            "ix_projects_deleted_at",
+            "deleted_at",
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     name: str = Field(
         sa_column=sa.Column(sa.String, nullable=False, index=True),
@@ -31,12 +89,53 @@ class Project(Base, table=True):
     owner_id: uuid.UUID | None = Field(
         default=None,
         foreign_key="users.id",
-        index=True,
+        ondelete="CASCADE",
         description="Owning user ID",
     )
 
+    # Denormalized counters over the project's live tasks, maintained by the
+    # statement-level triggers on `tasks` (migration 20261017_0006), which also
+    # bump `updated_at` when they change them (migration 20261017_0007)
+    task_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer, nullable=False, server_default="0"),
+        description="Number of tasks in the project",
+    )
+    todo_task_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer, nullable=False, server_default="0"),
+        description="Number of tasks with status 'todo'",
+    )
+    in_progress_task_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer, nullable=False, server_default="0"),
+        description="Number of tasks with status 'in_progress'",
+    )
+    done_task_count: int = Field(
+        default=0,
+        sa_column=sa.Column(sa.Integer, nullable=False, server_default="0"),
+        description="Number of tasks with status 'done'",
+    )
+
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=sa.Column(
+            TSVECTOR,
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(name, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        description="Full-text search document generated from name and description",
+    )
+
     owner: Optional["User"] = Relationship(back_populates="projects")
     tasks: list["Task"] = Relationship(
         back_populates="project",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        # Rows are removed by ON DELETE CASCADE, without loading them first
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
     )
@@ -3,20 +3,92 @@ from datetime import date
 from typing import TYPE_CHECKING, Optional
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlmodel import Field, Relationship
 
-from app.models.base import Base
+from app.models.base import SoftDeleteBase
 
 if TYPE_CHECKING:
     from app.models.project import Project
 
 
-class Task(Base, table=True):
+class Task(SoftDeleteBase, table=True):
     __tablename__ = "tasks"  # type: ignore[assignment]
+    __table_args__ = (
+        sa.Index("ix_tasks_search_vector", "search_vector", postgresql_using="gin"),
+        sa.Index(
+            "ix_tasks_title_trgm",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+        # Composite indexes matching the per-project list queries: filter columns
+        # first, then the sort column and the `id` keyset tie-breaker. B-tree
+        # indexes scan backwards, so each one serves both sort directions.
+        # This one also covers soft-deleted rows, so ON DELETE CASCADE from
+        # `projects` can use it; the others only index live rows.
+        sa.Index("ix_tasks_project_id_created_at", "project_id", "created_at", "id"),
+        sa.Index(
+            "ix_tasks_project_id_updated_at",
+            "project_id",
+            "updated_at",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_tasks_project_id_title",
+            "project_id",
+            "title",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_tasks_project_id_priority",
+            "project_id",
+            "priority",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_tasks_project_id_status_created_at",
+            "project_id",
+            "status",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_tasks_project_id_due_date",
+            "project_id",
+            "due_date",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        sa.Index(
+            "ix_tasks_project_id_status",
+            "project_id",
+            "status",
+            "id",
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        # Prefix matches of typeahead input too short for the trigram index
+        sa.Index(
+            "ix_tasks_project_id_lower_title",
+            "project_id",
+            sa.text("lower(title) text_pattern_ops"),
+            postgresql_where=sa.text("deleted_at IS NULL"),
+        ),
+        # Lets the purge job find soft-deleted rows without scanning live ones
+        sa.Index(
+            "ix_tasks_deleted_at",
+            "deleted_at",
+            postgresql_where=sa.text("deleted_at IS NOT NULL"),
+        ),
+    )
 
     project_id: uuid.UUID = Field(
         foreign_key="projects.id",
-        index=True,
+        ondelete="CASCADE",
         description="Parent project ID",
     )
     title: str = Field(
@@ -44,4 +116,17 @@ class Task(Base, table=True):
         description="Optional due date",
     )
 
+    search_vector: str | None = Field(
+        default=None,
+        sa_column=sa.Column(
+            TSVECTOR,
+            sa.Computed(
+                "setweight(to_tsvector('simple', coalesce(title, '')), 'A') || "
+                "setweight(to_tsvector('simple', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+        ),
+        description="Full-text search document generated from title and description",
+    )
+
     project: Optional["Project"] = Relationship(back_populates="tasks")
@@ -42,7 +42,11 @@ class User(Base, table=True):
 
     projects: list["Project"] = Relationship(
         back_populates="owner",
-        sa_relationship_kwargs={"cascade": "all, delete-orphan"},
+        # Rows are removed by ON DELETE CASCADE, without loading them first
+        sa_relationship_kwargs={
+            "cascade": "all, delete-orphan",
+            "passive_deletes": True,
+        },
     )
 
     @property
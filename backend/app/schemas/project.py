@@ -37,10 +37,31 @@ class ProjectRead(ProjectBase):
     id: uuid.UUID
     created_at: datetime
     updated_at: datetime
+    task_count: int = Field(default=0, description="Number of tasks")
+    todo_task_count: int = Field(default=0, description="Tasks with status 'todo'")
+    in_progress_task_count: int = Field(
+        default=0, description="Tasks with status 'in_progress'"
+    )
+    done_task_count: int = Field(default=0, description="Tasks with status 'done'")
 
 
 class ProjectListResponse(BaseModel):
     items: list[ProjectRead]
-    total: int
+    total: int | None = Field(
+        default=None, description="Total matches, null when count=none"
+    )
     skip: int
     limit: int
+    has_more: bool = Field(
+        default=False, description="Whether more items follow this page"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, null on the last page"
+    )
+
+
+class ProjectSuggestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
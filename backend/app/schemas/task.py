@@ -45,6 +45,21 @@ class TaskRead(TaskBase):
 
 class TaskListResponse(BaseModel):
     items: list[TaskRead]
-    total: int
+    total: int | None = Field(
+        default=None, description="Total matches, null when count=none"
+    )
     skip: int
     limit: int
+    has_more: bool = Field(
+        default=False, description="Whether more items follow this page"
+    )
+    next_cursor: str | None = Field(
+        default=None, description="Cursor for the next page, null on the last page"
+    )
+
+
+class TaskSuggestion(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    title: str
@@ -0,0 +1,99 @@
+"""Compare the two ways a 500-task `GET /tasks/` page can become JSON.
+
+"response_model" is what the task list endpoint used to do: build a
+`TaskListResponse` from the ORM objects and return it, after which FastAPI
+dumps it to dicts, validates those against the `response_model` again and
+encodes the result with `json.dumps`. "FastJSONResponse" is what it does now:
+build the `TaskListResponse` once and dump it to bytes with its compiled
+pydantic-core serializer. Needs no database:
+
+    python app/scripts/benchmark_serialization.py
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from datetime import date, datetime, timedelta
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import (  # FastAPI leaves some of its parameters untyped
+    create_model_field,  # pyright: ignore[reportUnknownVariableType]
+)
+
+from app.core.responses import FastJSONResponse
+from app.models.task import Task
+from app.schemas.task import TaskListResponse
+
+PAGE_SIZE = 500
+ITERATIONS = 200
+
+
+def _page() -> list[Task]:
+    project_id = uuid.uuid4()
+    now = datetime(2025, 1, 1)
+    return [
+        Task(
+            id=uuid.uuid4(),
+            project_id=project_id,
+            title=f"Task {i}",
+            description="Some longer text describing what needs to be done. " * 3,
+            status=("todo", "in_progress", "done")[i % 3],
+            priority=i % 5 + 1,
+            due_date=date(2025, 6, 1) if i % 2 else None,
+            created_at=now + timedelta(minutes=i),
+            updated_at=now + timedelta(minutes=i),
+        )
+        for i in range(PAGE_SIZE)
+    ]
+
+
+def _list_response(page: list[Task]) -> TaskListResponse:
+    return TaskListResponse(
+        items=page,  # type: ignore[arg-type]
+        total=PAGE_SIZE,
+        skip=0,
+        limit=PAGE_SIZE,
+        has_more=False,
+        next_cursor=None,
+    )
+
+
+def _response_model(page: list[Task]) -> Callable[[], Awaitable[bytes]]:
+    field = create_model_field("Response", TaskListResponse, mode="serialization")
+
+    async def render() -> bytes:
+        content = _list_response(page)
+        data = await serialize_response(field=field, response_content=content)
+        return bytes(JSONResponse(data).body)
+
+    return render
+
+
+def _fast_json_response(page: list[Task]) -> Callable[[], Awaitable[bytes]]:
+    async def render() -> bytes:
+        return bytes(FastJSONResponse(_list_response(page)).body)
+
+    return render
+
+
+async def _time(render: Callable[[], Awaitable[bytes]]) -> float:
+    await render()  # warm up the compiled validators and serializers
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        await render()
+    return (time.perf_counter() - start) / ITERATIONS * 1e3
+
+
+async def main() -> None:
+    page = _page()
+    default = await _time(_response_model(page))
+    fast = await _time(_fast_json_response(page))
+    print(f"{PAGE_SIZE}-task page, ms per response")
+    print(f"{'response_model + json.dumps':<34}{default:>9.2f}")
+    print(f"{'FastJSONResponse':<34}{fast:>9.2f}{default / fast:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
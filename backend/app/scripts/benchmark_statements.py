@@ -0,0 +1,110 @@
+"""Measure the per-call Python overhead of the hot CRUD read paths.
+
+Compares rebuilding each statement on every call (the cache is cleared before
+each call) with the statements cached by `CRUDBase._get_statement`. Calls stop
+where SQLAlchemy looks up the compiled SQL by cache key, so no database is
+needed:
+
+    python app/scripts/benchmark_statements.py
+"""
+
+import asyncio
+import time
+import uuid
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.base import CRUDBase
+from app.crud.project import project as crud_project
+from app.crud.task import task as crud_task
+from app.crud.user import user as crud_user
+
+ITERATIONS = 2000
+
+
+class _Result:
+    def scalars(self) -> "_Result":
+        return self
+
+    def all(self) -> list[Any]:
+        return []
+
+    def first(self) -> None:
+        return None
+
+    def scalar(self) -> int:
+        return 0
+
+
+class _CacheKeySession:
+    """Stands in for `AsyncSession`, doing only the cache key step of `execute()`."""
+
+    async def execute(self, statement: Any, params: Any = None) -> _Result:
+        statement._generate_cache_key()
+        return _Result()
+
+
+async def _time_call(
+    crud: CRUDBase[Any, Any, Any],
+    call: Callable[[AsyncSession], Awaitable[Any]],
+    *,
+    cached: bool,
+) -> float:
+    db: Any = _CacheKeySession()
+    await call(db)  # warm up
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        if not cached:
+            crud.clear_statement_cache()
+        await call(db)
+    return (time.perf_counter() - start) / ITERATIONS * 1e6
+
+
+async def main() -> None:
+    owner_id = uuid.uuid4()
+    cases: dict[
+        str, tuple[CRUDBase[Any, Any, Any], Callable[[Any], Awaitable[Any]]]
+    ] = {
+        "CRUDBase.get": (
+            crud_project,
+            lambda db: crud_project.get(db, id=owner_id),
+        ),
+        "CRUDUser.get_by_auth0_sub": (
+            crud_user,
+            lambda db: crud_user.get_by_auth0_sub(db, auth0_sub="auth0|benchmark"),
+        ),
+        "CRUDProject.get_multi_filtered": (
+            crud_project,
+            lambda db: crud_project.get_multi_filtered(
+                db, owner_id=owner_id, status="active", sort_by="name"
+            ),
+        ),
+        "CRUDProject.get_multi_filtered (search)": (
+            crud_project,
+            lambda db: crud_project.get_multi_filtered(
+                db, owner_id=owner_id, search="roadmap", sort_by="relevance"
+            ),
+        ),
+        "CRUDTask.get_multi_filtered": (
+            crud_task,
+            lambda db: crud_task.get_multi_filtered(
+                db, project_id=owner_id, status="todo", sort_by="due_date"
+            ),
+        ),
+        "CRUDTask.get_count_filtered": (
+            crud_task,
+            lambda db: crud_task.get_count_filtered(db, project_id=owner_id),
+        ),
+    }
+
+    print(f"{'query':<42}{'rebuilt':>12}{'cached':>12}{'speedup':>10}")
+    for name, (crud, call) in cases.items():
+        rebuilt = await _time_call(crud, call, cached=False)
+        cached = await _time_call(crud, call, cached=True)
+        print(f"{name:<42}{rebuilt:>9.1f} us{cached:>9.1f} us{rebuilt / cached:>9.1f}x")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,96 @@
+"""Measure the cost of loading the current user, which happens on every request.
+
+Compares SQLAlchemy's default asyncpg setup (stdlib json) with the tuned
+connections from `app.core.db` (orjson deserializer, larger prepared
+statement cache, jit off). The codec comparison needs no database; pass
+`--database` to also time `CRUDUser.get_by_auth0_sub` against the configured
+database, which must contain at least one user:
+
+    python app/scripts/benchmark_user_load.py [--database]
+"""
+
+import asyncio
+import json
+import sys
+import time
+from collections.abc import Awaitable, Callable
+from typing import Any
+
+import orjson
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlmodel import select
+
+from app.core.config import settings
+from app.core.db import async_session
+from app.crud.user import user as crud_user
+from app.models.user import User
+
+CODEC_ITERATIONS = 200_000
+LOAD_ITERATIONS = 2000
+
+# `User.roles` as it arrives from the server in binary jsonb format
+ROLES_JSONB = b"\x01" + json.dumps(["user", "admin", "project-manager"]).encode()
+
+
+def _stdlib_jsonb_decoder(value: bytes) -> Any:
+    # What the asyncpg dialect registers by default
+    return json.loads(value[1:].decode())
+
+
+def _orjson_jsonb_decoder(value: bytes) -> Any:
+    # The same codec with `json_deserializer=orjson.loads`, see `app.core.db`
+    return orjson.loads(value[1:].decode())
+
+
+def _time_decoder(decoder: Callable[[bytes], Any]) -> float:
+    start = time.perf_counter()
+    for _ in range(CODEC_ITERATIONS):
+        decoder(ROLES_JSONB)
+    return (time.perf_counter() - start) / CODEC_ITERATIONS * 1e9
+
+
+async def _time_load(
+    sessionmaker: async_sessionmaker[AsyncSession], auth0_sub: str
+) -> float:
+    async def load() -> None:
+        async with sessionmaker() as session:
+            await crud_user.get_by_auth0_sub(session, auth0_sub=auth0_sub)
+
+    await load()  # warm up the pool and statement caches
+    start = time.perf_counter()
+    for _ in range(LOAD_ITERATIONS):
+        await load()
+    return (time.perf_counter() - start) / LOAD_ITERATIONS * 1e6
+
+
+async def _benchmark_database() -> None:
+    async with async_session() as session:
+        auth0_sub = (await session.execute(select(User.auth0_sub).limit(1))).scalar()
+    if auth0_sub is None:
+        print("No users in the database, skipping the user load benchmark")
+        return
+
+    default_engine = create_async_engine(str(settings.SQLALCHEMY_DATABASE_URI))
+    cases: dict[str, Callable[[], Awaitable[float]]] = {
+        "default connections": lambda: _time_load(
+            async_sessionmaker(default_engine, expire_on_commit=False), auth0_sub
+        ),
+        "tuned connections": lambda: _time_load(async_session, auth0_sub),
+    }
+    for name, run in cases.items():
+        print(f"{'load user (' + name + ')':<42}{await run():>9.1f} us")
+    await default_engine.dispose()
+
+
+async def main() -> None:
+    stdlib = _time_decoder(_stdlib_jsonb_decoder)
+    tuned = _time_decoder(_orjson_jsonb_decoder)
+    print(f"{'decode roles (stdlib json)':<42}{stdlib:>9.1f} ns")
+    print(f"{'decode roles (orjson)':<42}{tuned:>9.1f} ns{stdlib / tuned:>9.1f}x")
+
+    if "--database" in sys.argv[1:]:
+        await _benchmark_database()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
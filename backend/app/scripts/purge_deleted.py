@@ -0,0 +1,78 @@
+import asyncio
+import logging
+from collections.abc import Awaitable, Callable
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.config import settings
+from app.core.db import async_session
+from app.crud.base import CRUDBase
+from app.crud.collection_version import CollectionScope, purge_orphaned_versions
+from app.crud.project import project as crud_project
+from app.crud.task import task as crud_task
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+
+async def purge(crud: CRUDBase[Any, Any, Any], deleted_before: datetime) -> int:
+    """Purge soft-deleted rows of one model, one short transaction per chunk."""
+    return await _purge_in_chunks(
+        lambda session, limit: crud.purge_deleted(
+            session, deleted_before=deleted_before, limit=limit
+        )
+    )
+
+
+async def purge_versions(scope: CollectionScope) -> int:
+    """Purge the versions of removed collections, one transaction per chunk."""
+    return await _purge_in_chunks(
+        lambda session, limit: purge_orphaned_versions(
+            session, scope=scope, limit=limit
+        )
+    )
+
+
+async def purge_deleted() -> None:
+    deleted_before = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(
+        days=settings.SOFT_DELETE_RETENTION_DAYS
+    )
+    # Tasks first: this includes the tasks of purged projects, so the project
+    # deletes below no longer cascade to any rows
+    tasks = await purge(crud_task, deleted_before)
+    projects = await purge(crud_project, deleted_before)
+    # Last, as both purges above bump the versions of the collections they empty
+    versions = await purge_versions("tasks") + await purge_versions("projects")
+    logger.info(
+        "Purged %d tasks, %d projects and %d collection versions deleted before %s",
+        tasks,
+        projects,
+        versions,
+        deleted_before.isoformat(),
+    )
+
+
+async def _purge_in_chunks(
+    purge_chunk: Callable[[AsyncSession, int], Awaitable[int]],
+) -> int:
+    purged = 0
+    while True:
+        async with async_session.begin() as session:
+            count = await purge_chunk(session, settings.SOFT_DELETE_PURGE_BATCH_SIZE)
+        purged += count
+        if count < settings.SOFT_DELETE_PURGE_BATCH_SIZE:
+            return purged
+
+
+async def main() -> None:
+    while True:
+        await purge_deleted()
+        if settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS <= 0:
+            return
+        await asyncio.sleep(settings.SOFT_DELETE_PURGE_INTERVAL_SECONDS)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
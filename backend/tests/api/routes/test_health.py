@@ -1,6 +1,8 @@
 import pytest
 from httpx import AsyncClient
 
+from app.core.config import settings
+
 
 @pytest.mark.asyncio
 class TestHealthRoutes:
@@ -15,3 +17,11 @@ class TestHealthRoutes:
         data = response.json()
         assert data["status"] == "ready"
         assert data["database"] == "connected"
+
+    async def test_pool_stats(self, async_client: AsyncClient):
+        response = await async_client.get("/api/v1/pool-stats")
+        assert response.status_code == 200
+        primary = response.json()["primary"]
+        assert primary["size"] == settings.POSTGRES_POOL_SIZE
+        for key in ("checked_out", "overflow", "waiting", "wait_seconds_avg"):
+            assert key in primary
@@ -3,8 +3,10 @@ from httpx import AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.crud.project import project as crud_project
+from app.crud.task import task as crud_task
 from app.models.user import User
 from app.schemas.project import ProjectCreate
+from app.schemas.task import TaskCreate
 
 
 @pytest.mark.asyncio
@@ -117,3 +119,267 @@ class TestProjectRoutes:
 
         deleted = await crud_project.get(db_session, id=project.id)
         assert deleted is None
+
+    async def test_get_project_includes_task_counters(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Counter Project", owner_id=test_user.id),
+        )
+        await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(title="Open", project_id=project.id),
+                TaskCreate(title="Closed", status="done", project_id=project.id),
+            ],
+        )
+        db_session.expunge_all()
+
+        response = await async_client.get(f"/api/v1/projects/{project.id}")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["task_count"] == 2
+        assert data["todo_task_count"] == 1
+        assert data["done_task_count"] == 1
+
+    async def test_get_project_conditional(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Polled Project", owner_id=test_user.id),
+        )
+        url = f"/api/v1/projects/{project.id}"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await async_client.get(
+            url, headers={"If-Modified-Since": "Mon, 01 Jan 2001 00:00:00 GMT"}
+        )
+        assert response.status_code == 200
+
+        # Task counters are part of the project, so changing them changes the ETag
+        await crud_task.create(
+            db_session, obj_in=TaskCreate(title="New", project_id=project.id)
+        )
+        db_session.expunge_all()
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["task_count"] == 1
+
+    async def test_restore_deleted_project(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Restore Me", owner_id=test_user.id),
+        )
+        task = await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(title="Restore Task", project_id=project.id),
+        )
+
+        response = await async_client.delete(f"/api/v1/projects/{project.id}")
+        assert response.status_code == 200
+        response = await async_client.get(f"/api/v1/projects/{project.id}")
+        assert response.status_code == 404
+
+        response = await async_client.post(f"/api/v1/projects/{project.id}/restore")
+        assert response.status_code == 200
+        assert response.json()["id"] == str(project.id)
+
+        response = await async_client.get(f"/api/v1/tasks/{task.id}")
+        assert response.status_code == 200
+
+    async def test_restore_live_project_not_found(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Not Deleted", owner_id=test_user.id),
+        )
+
+        response = await async_client.post(f"/api/v1/projects/{project.id}/restore")
+        assert response.status_code == 404
+
+    async def test_list_my_projects_conditional(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Dashboard", owner_id=test_user.id),
+        )
+        url = "/api/v1/projects/me"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+
+        # Other parameters select a different response
+        response = await async_client.get(
+            f"{url}?limit=1", headers={"If-None-Match": etag}
+        )
+        assert response.status_code == 200
+
+        # So does any change to the projects, including their task counters
+        await crud_task.create(
+            db_session, obj_in=TaskCreate(title="New", project_id=project.id)
+        )
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    async def test_list_my_projects_with_cursor(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        for i in range(3):
+            await crud_project.create(
+                db_session,
+                obj_in=ProjectCreate(name=f"Paged {i}", owner_id=test_user.id),
+            )
+
+        first = (await async_client.get("/api/v1/projects/me?limit=2")).json()
+        assert len(first["items"]) == 2
+        assert first["next_cursor"]
+
+        second = (
+            await async_client.get(
+                f"/api/v1/projects/me?limit=2&cursor={first['next_cursor']}"
+            )
+        ).json()
+        assert len(second["items"]) == 1
+        assert second["next_cursor"] is None
+        first_ids = {item["id"] for item in first["items"]}
+        assert second["items"][0]["id"] not in first_ids
+
+    async def test_list_projects_invalid_cursor(self, async_client: AsyncClient):
+        response = await async_client.get("/api/v1/projects/me?cursor=not-a-cursor")
+        assert response.status_code == 400
+
+    async def test_list_my_projects_without_count(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        for i in range(3):
+            await crud_project.create(
+                db_session,
+                obj_in=ProjectCreate(name=f"Uncounted {i}", owner_id=test_user.id),
+            )
+
+        response = await async_client.get("/api/v1/projects/me?limit=2&count=none")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] is None
+        assert data["has_more"] is True
+        assert len(data["items"]) == 2
+
+    async def test_list_my_projects_estimated_count(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Estimated", owner_id=test_user.id),
+        )
+
+        response = await async_client.get("/api/v1/projects/me?count=estimated")
+        assert response.status_code == 200
+        data = response.json()
+        assert isinstance(data["total"], int)
+        assert data["has_more"] is False
+
+    async def test_list_my_projects_sparse_fields(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(
+                name="Sparse", description="Long text", owner_id=test_user.id
+            ),
+        )
+
+        response = await async_client.get("/api/v1/projects/me?fields=name,status")
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 1
+        assert set(data["items"][0]) == {"id", "name", "status"}
+        assert data["items"][0]["name"] == "Sparse"
+
+    async def test_list_my_projects_unknown_field(self, async_client: AsyncClient):
+        response = await async_client.get("/api/v1/projects/me?fields=name,secret")
+        assert response.status_code == 400
+        assert response.json()["detail"] == "Unknown fields: secret"
+
+    async def test_suggest_projects(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        test_admin_user: User,
+    ):
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Website Redesign", owner_id=test_user.id),
+        )
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Website Audit", owner_id=test_admin_user.id),
+        )
+
+        response = await async_client.get("/api/v1/projects/suggest?q=websi")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["name"] for item in data] == ["Website Redesign"]
+        assert set(data[0]) == {"id", "name"}
+
+    async def test_create_projects_bulk_sets_owner(
+        self,
+        async_client: AsyncClient,
+        test_user: User,
+        test_admin_user: User,
+    ):
+        payload = [
+            {"name": "Bulk A"},
+            {"name": "Bulk B", "owner_id": str(test_admin_user.id)},
+        ]
+        response = await async_client.post("/api/v1/projects/bulk", json=payload)
+        assert response.status_code == 201
+        data = response.json()
+        assert [item["name"] for item in data] == ["Bulk A", "Bulk B"]
+        assert all(item["owner_id"] == str(test_user.id) for item in data)
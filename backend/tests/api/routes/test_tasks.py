@@ -55,6 +55,64 @@ class TestTaskRoutes:
         assert data["total"] == 2
         assert len(data["items"]) == 2
 
+    async def test_list_tasks_conditional(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="My Project", owner_id=test_user.id),
+        )
+        task = await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(project_id=project.id, title="Task 1"),
+        )
+        url = f"/api/v1/tasks/?project_id={project.id}"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+
+        response = await async_client.get(
+            url, headers={"If-Modified-Since": response.headers["last-modified"]}
+        )
+        assert response.status_code == 304
+
+        await crud_task.update(db_session, db_obj=task, obj_in={"title": "Renamed"})
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["items"][0]["title"] == "Renamed"
+
+    async def test_list_tasks_sparse_fields(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="My Project", owner_id=test_user.id),
+        )
+        await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(
+                project_id=project.id, title="Task 1", description="Long text"
+            ),
+        )
+
+        response = await async_client.get(
+            f"/api/v1/tasks/?project_id={project.id}&fields=title,status"
+        )
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert items == [{"id": items[0]["id"], "title": "Task 1", "status": "todo"}]
+
     async def test_list_tasks_admin_without_project_id(
         self,
         async_client: AsyncClient,
@@ -132,6 +190,45 @@ class TestTaskRoutes:
         response = await async_client.get(f"/api/v1/tasks/{task.id}")
         assert response.status_code == 403
 
+    async def test_get_task_conditional(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Polled Project", owner_id=test_user.id),
+        )
+        task = await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(project_id=project.id, title="Polled Task"),
+        )
+        url = f"/api/v1/tasks/{task.id}"
+
+        response = await async_client.get(url)
+        assert response.status_code == 200
+        etag = response.headers["etag"]
+        last_modified = response.headers["last-modified"]
+        assert etag.startswith('W/"')
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+        response = await async_client.get(
+            url, headers={"If-Modified-Since": last_modified}
+        )
+        assert response.status_code == 304
+
+        await crud_task.update(db_session, db_obj=task, obj_in={"title": "Changed"})
+
+        response = await async_client.get(url, headers={"If-None-Match": etag})
+        assert response.status_code == 200
+        assert response.json()["title"] == "Changed"
+        assert response.headers["etag"] != etag
+
     async def test_update_task(
         self,
         async_client: AsyncClient,
@@ -175,3 +272,138 @@ class TestTaskRoutes:
 
         deleted = await crud_task.get(db_session, id=task.id)
         assert deleted is None
+
+    async def test_suggest_tasks(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Suggest Project", owner_id=test_user.id),
+        )
+        await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(project_id=project.id, title="Write release notes"),
+        )
+        await crud_task.create(
+            db_session,
+            obj_in=TaskCreate(project_id=project.id, title="Plan sprint"),
+        )
+
+        response = await async_client.get("/api/v1/tasks/suggest?q=release")
+        assert response.status_code == 200
+        data = response.json()
+        assert [item["title"] for item in data] == ["Write release notes"]
+
+    async def test_suggest_tasks_short_query_matches_prefixes(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Suggest Project", owner_id=test_user.id),
+        )
+        await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(project_id=project.id, title=title)
+                for title in ["write docs", "Plan sprint", "Write tests", "Rewrite"]
+            ],
+        )
+
+        response = await async_client.get("/api/v1/tasks/suggest?q=Wr")
+        assert response.status_code == 200
+        data = response.json()
+        # Case-insensitive prefix matches in name order; "Rewrite" only
+        # contains the query
+        assert [item["title"] for item in data] == ["write docs", "Write tests"]
+
+    async def test_create_tasks_bulk(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+    ):
+        project = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Bulk Project", owner_id=test_user.id),
+        )
+
+        payload = [
+            {"project_id": str(project.id), "title": f"Checklist {i}"} for i in range(3)
+        ]
+        response = await async_client.post("/api/v1/tasks/bulk", json=payload)
+        assert response.status_code == 201
+        assert [item["title"] for item in response.json()] == [
+            "Checklist 0",
+            "Checklist 1",
+            "Checklist 2",
+        ]
+
+    async def test_create_tasks_bulk_forbidden_project(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        test_admin_user: User,
+    ):
+        own = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Own Project", owner_id=test_user.id),
+        )
+        other = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Other Project", owner_id=test_admin_user.id),
+        )
+
+        payload = [
+            {"project_id": str(own.id), "title": "Allowed"},
+            {"project_id": str(other.id), "title": "Not allowed"},
+        ]
+        response = await async_client.post("/api/v1/tasks/bulk", json=payload)
+        assert response.status_code == 403
+
+    async def test_update_tasks_bulk_skips_foreign_tasks(
+        self,
+        async_client: AsyncClient,
+        db_session: AsyncSession,
+        test_user: User,
+        test_admin_user: User,
+    ):
+        own = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Own Board", owner_id=test_user.id),
+        )
+        other = await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(name="Other Board", owner_id=test_admin_user.id),
+        )
+        own_tasks = [
+            await crud_task.create(
+                db_session, obj_in=TaskCreate(project_id=own.id, title=f"Own {i}")
+            )
+            for i in range(2)
+        ]
+        foreign_task = await crud_task.create(
+            db_session, obj_in=TaskCreate(project_id=other.id, title="Foreign")
+        )
+
+        response = await async_client.patch(
+            "/api/v1/tasks/bulk",
+            json={
+                "ids": [str(t.id) for t in [*own_tasks, foreign_task]],
+                "patch": {"status": "done", "priority": 1},
+            },
+        )
+        assert response.status_code == 200
+        data = response.json()
+        assert {item["id"] for item in data} == {str(t.id) for t in own_tasks}
+        assert all(item["status"] == "done" for item in data)
+        assert all(item["priority"] == 1 for item in data)
+
+        await db_session.refresh(foreign_task)
+        assert foreign_task.status == "todo"
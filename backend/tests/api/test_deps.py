@@ -1,11 +1,20 @@
 """Unit tests for authentication dependencies."""
 
-import pytest
-from fastapi import HTTPException
-from sqlalchemy.ext.asyncio import AsyncSession
+import uuid
+from http.cookies import SimpleCookie
 
-from app.api.deps import _get_or_create_user, current_user
+import pytest
+from fastapi import HTTPException, Request, Response
+from sqlalchemy import event, select, text, update
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
+from sqlalchemy.sql.expression import Executable
+
+from app.api import deps as deps_module
+from app.api.deps import _get_or_create_user, current_user, get_db, get_read_db
+from app.core.db import PrimaryPins, WriteTrackingSession, _read_only
 from app.crud.user import user as crud_user
+from app.logic.utils.db_utils import Explain
 from app.models.user import User
 
 
@@ -114,6 +123,24 @@ class TestCurrentUserDependency:
         assert user.id == test_user.id
         assert user.is_active is True
 
+    async def test_current_user_on_get_leaves_primary_unused(
+        self,
+        test_engine: AsyncEngine,
+        db_session: AsyncSession,
+        test_user: User,
+        mock_auth0_claims: dict,
+    ):
+        """Test that GET requests look an existing user up on the read session."""
+        async with async_sessionmaker(test_engine)() as primary:
+            primary.info["safe_method"] = True
+
+            user = await current_user()(
+                session=primary, claims=mock_auth0_claims, read_session=db_session
+            )
+
+            assert user.id == test_user.id
+            assert primary.get_transaction() is None
+
     async def test_current_user_inactive_raises_error(
         self,
         db_session: AsyncSession,
@@ -359,3 +386,125 @@ class TestRoleNormalization:
 
         result = _normalize_required_roles(("admin", "user"))
         assert result == ["admin", "user"]
+
+
+def _request(method: str, pin: str | None = None) -> Request:
+    headers = [(b"authorization", b"Bearer token")]
+    if pin is not None:
+        headers.append((b"cookie", f"{PrimaryPins.COOKIE}={pin}".encode()))
+    return Request({"type": "http", "method": method, "headers": headers})
+
+
+class TestPrimaryPins:
+    """Test suite for the signed read-your-writes pin."""
+
+    def test_pin_is_valid_until_it_expires(self):
+        assert PrimaryPins(5.0, "secret").is_pinned(PrimaryPins(5.0, "secret").pin())
+        assert not PrimaryPins(-1.0, "secret").is_pinned(
+            PrimaryPins(-1.0, "secret").pin()
+        )
+
+    def test_forged_pins_are_ignored(self):
+        pins = PrimaryPins(5.0, "secret")
+        until, _, signature = pins.pin().rpartition(".")
+
+        assert not pins.is_pinned(None)
+        assert not pins.is_pinned(until)
+        assert not pins.is_pinned(f"{float(until) + 60}.{signature}")
+        assert not pins.is_pinned(PrimaryPins(5.0, "other").pin())
+        assert not pins.is_pinned("ünïcode")
+
+
+@pytest.mark.asyncio
+class TestGetReadDb:
+    """Test suite for read-only sessions and routing reads to the replica."""
+
+    @pytest.fixture(autouse=True)
+    def _replica(self, monkeypatch: pytest.MonkeyPatch, test_engine: AsyncEngine):
+        # Both sessionmakers use the test database, the replica is told apart
+        # by its session info
+        self.primary = async_sessionmaker(_read_only(test_engine))
+        self.replica = async_sessionmaker(
+            _read_only(test_engine), info={"replica": True}
+        )
+        monkeypatch.setattr(deps_module, "read_session", self.primary)
+        monkeypatch.setattr(deps_module, "replica_session", self.replica)
+        monkeypatch.setattr(
+            deps_module,
+            "async_session",
+            async_sessionmaker(test_engine, sync_session_class=WriteTrackingSession),
+        )
+        monkeypatch.setattr(deps_module, "primary_pins", PrimaryPins(5.0, "secret"))
+
+    async def _is_replica(self, pin: str | None = None) -> bool:
+        dependency = get_read_db(_request("GET", pin=pin))
+        session = await anext(dependency)
+        is_replica = session.info.get("replica", False)
+        await dependency.aclose()
+        return is_replica
+
+    async def test_reads_from_primary_without_replica(
+        self, monkeypatch: pytest.MonkeyPatch
+    ):
+        monkeypatch.setattr(deps_module, "replica_session", None)
+
+        assert await self._is_replica() is False
+
+    async def test_reads_from_replica(self):
+        assert await self._is_replica() is True
+
+    async def test_transaction_is_read_only(self):
+        dependency = get_read_db(_request("GET"))
+        session = await anext(dependency)
+
+        result = await session.execute(text("SHOW transaction_read_only"))
+        assert result.scalar() == "on"
+        await dependency.aclose()
+
+    async def test_writer_is_pinned_to_primary(self):
+        response = Response()
+        write = get_db(_request("POST"), response)
+        await anext(write)
+        await write.aclose()
+
+        cookie = SimpleCookie(response.headers["set-cookie"])
+        assert await self._is_replica(cookie[PrimaryPins.COOKIE].value) is False
+        # Other clients still read from the replica
+        assert await self._is_replica() is True
+
+
+@pytest.mark.asyncio
+class TestGetDb:
+    """Test suite for the lazily committed primary session."""
+
+    @pytest.fixture(autouse=True)
+    def _primary(self, monkeypatch: pytest.MonkeyPatch, test_engine: AsyncEngine):
+        primary = async_sessionmaker(
+            test_engine,
+            sync_session_class=WriteTrackingSession,
+            expire_on_commit=False,
+        )
+        monkeypatch.setattr(deps_module, "async_session", primary)
+
+    async def _count_commits(self, statement: Executable) -> int:
+        commits: list[Session] = []
+        dependency = get_db(_request("POST"), Response())
+        session = await anext(dependency)
+        # Nothing is checked out before the first query
+        assert session.get_transaction() is None
+
+        event.listen(session.sync_session, "after_commit", commits.append)
+        await session.execute(statement)
+        with pytest.raises(StopAsyncIteration):
+            await anext(dependency)
+        return len(commits)
+
+    async def test_reads_are_not_committed(self):
+        assert await self._count_commits(select(User.id).limit(1)) == 0
+
+    async def test_explain_is_not_committed(self):
+        assert await self._count_commits(Explain(select(User.id))) == 0
+
+    async def test_writes_are_committed(self):
+        statement = update(User).where(User.id == uuid.uuid4()).values(name="x")
+        assert await self._count_commits(statement) == 1
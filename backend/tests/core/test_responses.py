@@ -0,0 +1,118 @@
+"""Unit tests for the JSON responses that bypass `response_model` serialization."""
+
+import enum
+import uuid
+from collections.abc import Sequence
+from datetime import date, datetime, timezone
+from typing import Any
+
+import pytest
+from fastapi import FastAPI
+from fastapi.responses import JSONResponse
+from httpx import ASGITransport, AsyncClient
+from pydantic import BaseModel, ConfigDict
+from sqlalchemy import Row
+from sqlalchemy.engine.result import IteratorResult, SimpleResultMetaData
+
+from app.core.responses import FastJSONResponse, serialize_as
+from app.schemas.task import TaskListResponse, TaskRead
+
+
+class Color(str, enum.Enum):
+    RED = "red"
+    GREEN = "green"
+
+
+class Sample(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: uuid.UUID
+    name: str
+    color: Color
+    created_at: datetime
+    updated_at: datetime
+    due_date: date | None
+    note: str | None
+
+
+SAMPLE = Sample(
+    id=uuid.UUID("0b6f1d7e-58a5-4a9e-9d4c-3f1b2a6c7d8e"),
+    name='Café "quoted" ✓',
+    color=Color.GREEN,
+    created_at=datetime(2026, 10, 17, 8, 30, 5, 123456),
+    updated_at=datetime(2026, 10, 17, 8, 30, 5, tzinfo=timezone.utc),
+    due_date=date(2026, 11, 1),
+    note=None,
+)
+
+
+def _task_rows() -> Sequence[Row[Any]]:
+    # Rows as the list queries return them: TaskRead's columns, no entity
+    keys = list(TaskRead.model_fields)
+    values = [
+        {
+            "project_id": uuid.UUID("5d3c2b1a-0f9e-4d8c-8b7a-6e5f4d3c2b1a"),
+            "title": f"Task {i}",
+            "description": None if i % 2 else "Ünïcode description",
+            "status": "in_progress",
+            "priority": i + 1,
+            "due_date": None if i % 2 else date(2026, 12, 24),
+            "id": uuid.UUID(int=i + 1),
+            "created_at": datetime(2026, 10, 17, 12, 0, i),
+            "updated_at": datetime(2026, 10, 17, 12, 0, i, 500000),
+        }
+        for i in range(3)
+    ]
+    rows = iter([tuple(value[key] for key in keys) for value in values])
+    return IteratorResult(SimpleResultMetaData(keys), rows).all()
+
+
+async def _response_model_body(response_model: Any, value: Any) -> bytes:
+    """The body FastAPI renders for `value` through `response_model`."""
+    app = FastAPI(default_response_class=JSONResponse)
+
+    @app.get("/", response_model=response_model)
+    async def endpoint() -> Any:
+        return value
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/")
+    return response.content
+
+
+@pytest.mark.asyncio
+class TestFastJSONResponse:
+    """Test that the fast paths render the same bytes as `response_model`."""
+
+    async def test_model_matches_response_model(self):
+        expected = await _response_model_body(Sample, SAMPLE)
+
+        assert FastJSONResponse(SAMPLE).body == expected
+
+    async def test_dict_matches_response_model(self):
+        expected = await _response_model_body(Sample, SAMPLE)
+
+        assert FastJSONResponse(SAMPLE.model_dump(mode="json")).body == expected
+
+    async def test_serialize_as_matches_response_model(self):
+        expected = await _response_model_body(Sample, SAMPLE)
+
+        response = serialize_as(Sample, SAMPLE, headers={"ETag": 'W/"x"'})
+
+        assert response.body == expected
+        assert response.media_type == "application/json"
+        assert response.headers["ETag"] == 'W/"x"'
+
+    async def test_list_of_rows_matches_response_model(self):
+        rows = _task_rows()
+        page = {"total": None, "skip": 0, "limit": 3, "next_cursor": "abc"}
+        expected = await _response_model_body(TaskListResponse, {"items": rows, **page})
+
+        # As the list routes build it
+        content = TaskListResponse(items=list(rows), **page)  # type: ignore[arg-type]
+
+        assert FastJSONResponse(content).body == expected
+        assert serialize_as(list[TaskRead], rows).body == (
+            await _response_model_body(list[TaskRead], rows)
+        )
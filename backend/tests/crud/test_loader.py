@@ -0,0 +1,76 @@
+"""Unit tests for the batch loader."""
+
+import asyncio
+import uuid
+
+import pytest
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.crud.loader import get_loader
+from app.crud.project import project as crud_project
+from app.models.project import Project
+from app.models.user import User
+from app.schemas.project import ProjectCreate
+
+
+@pytest.mark.asyncio
+class TestBatchLoader:
+    """Test suite for coalescing lookups by id."""
+
+    @pytest.fixture(autouse=True)
+    def _count_queries(self, db_session: AsyncSession):
+        self.queries = 0
+
+        def count(_):
+            self.queries += 1
+
+        event.listen(db_session.sync_session, "do_orm_execute", count)
+        yield
+        event.remove(db_session.sync_session, "do_orm_execute", count)
+
+    async def test_gathered_loads_share_one_query(
+        self, db_session: AsyncSession, test_project: Project, test_user: User
+    ):
+        other = await crud_project.create(
+            db_session, obj_in=ProjectCreate(name="Other", owner_id=test_user.id)
+        )
+        missing = uuid.uuid4()
+        self.queries = 0
+
+        loader = get_loader(db_session)
+        results = await asyncio.gather(
+            loader.load(crud_project, test_project.id),
+            loader.load(crud_project, other.id),
+            loader.load(crud_project, missing),
+        )
+
+        assert [r.id if r else None for r in results] == [
+            test_project.id,
+            other.id,
+            None,
+        ]
+        assert self.queries == 1
+
+    async def test_load_many_keeps_order_and_duplicates(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        self.queries = 0
+
+        loader = get_loader(db_session)
+        results = await loader.load_many(
+            crud_project, [test_project.id, uuid.uuid4(), test_project.id]
+        )
+
+        assert results == [test_project, None, test_project]
+        assert self.queries == 1
+
+    async def test_soft_deleted_rows_are_missing(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        await crud_project.remove(db_session, id=test_project.id)
+
+        assert await get_loader(db_session).load(crud_project, test_project.id) is None
+
+    async def test_loader_is_shared_per_session(self, db_session: AsyncSession):
+        assert get_loader(db_session) is get_loader(db_session)
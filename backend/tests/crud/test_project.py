@@ -1,13 +1,24 @@
 """Unit tests for Project CRUD operations."""
 
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import Select, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.collection_version import (
+    get_collection_version,
+    purge_orphaned_versions,
+)
+from app.crud.project import CRUDProject
 from app.crud.project import project as crud_project
+from app.crud.task import task as crud_task
 from app.models.project import Project
 from app.models.user import User
 from app.schemas.project import ProjectCreate, ProjectUpdate
+from app.schemas.task import TaskCreate
 
 
 @pytest.mark.asyncio
@@ -129,6 +140,232 @@ class TestProjectCRUD:
         project = await crud_project.get(db_session, id=project_id)
         assert project is None
 
+    async def test_restore_project(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test that a removed project is kept until purged and can be restored."""
+        await crud_project.remove(db_session, id=test_project.id)
+
+        deleted = await crud_project.get(
+            db_session, id=test_project.id, include_deleted=True
+        )
+        assert deleted is not None
+        assert deleted.is_deleted
+
+        restored = await crud_project.restore(db_session, id=test_project.id)
+        assert restored is not None
+        assert restored.deleted_at is None
+        assert await crud_project.get(db_session, id=test_project.id) is not None
+
+    async def test_purge_deleted_project_with_tasks(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test that purging removes soft-deleted projects and their tasks."""
+        tasks = await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(title=f"Purge Task {i}", project_id=test_project.id)
+                for i in range(3)
+            ],
+        )
+        await crud_project.remove(db_session, id=test_project.id)
+        deleted_before = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=1
+        )
+
+        purged_tasks = await crud_task.purge_deleted(
+            db_session, deleted_before=deleted_before, limit=2
+        )
+        assert purged_tasks == 2
+        purged_tasks += await crud_task.purge_deleted(
+            db_session, deleted_before=deleted_before, limit=2
+        )
+        assert purged_tasks == len(tasks)
+
+        purged_projects = await crud_project.purge_deleted(
+            db_session, deleted_before=deleted_before
+        )
+        assert purged_projects == 1
+        db_session.expunge_all()
+        assert (
+            await crud_project.get(db_session, id=test_project.id, include_deleted=True)
+            is None
+        )
+        assert await crud_task.get_multi(db_session, ids=[t.id for t in tasks]) == []
+
+    async def test_purge_deleted_tasks_fills_chunk_from_both_passes(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a task purge chunk spans removed tasks and removed projects."""
+        kept, removed = await crud_project.create_many(
+            db_session,
+            objs_in=[
+                ProjectCreate(name="Kept", owner_id=test_user.id),
+                ProjectCreate(name="Removed", owner_id=test_user.id),
+            ],
+        )
+        tasks = await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(title="Removed task", project_id=kept.id),
+                TaskCreate(title="Kept task", project_id=kept.id),
+                TaskCreate(title="In removed project", project_id=removed.id),
+            ],
+        )
+        await crud_task.remove(db_session, id=tasks[0].id)
+        await crud_project.remove(db_session, id=removed.id)
+        deleted_before = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=1
+        )
+
+        purged = await crud_task.purge_deleted(
+            db_session, deleted_before=deleted_before, limit=3
+        )
+
+        assert purged == 2
+        db_session.expunge_all()
+        remaining = await crud_task.get_multi(db_session, ids=[t.id for t in tasks])
+        assert [task.id for task in remaining] == [tasks[1].id]
+
+    async def test_purge_orphaned_versions(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that versions of purged projects are removed, others kept."""
+        kept, purged = await crud_project.create_many(
+            db_session,
+            objs_in=[
+                ProjectCreate(name="Kept", owner_id=test_user.id),
+                ProjectCreate(name="Purged", owner_id=test_user.id),
+            ],
+        )
+        await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(title="Kept task", project_id=kept.id),
+                TaskCreate(title="Purged task", project_id=purged.id),
+            ],
+        )
+        await crud_project.remove(db_session, id=purged.id)
+        deleted_before = datetime.now(timezone.utc).replace(tzinfo=None) + timedelta(
+            minutes=1
+        )
+        await crud_task.purge_deleted(db_session, deleted_before=deleted_before)
+        await crud_project.purge_deleted(db_session, deleted_before=deleted_before)
+        assert await get_collection_version(db_session, scope="tasks", key=purged.id)
+
+        assert await purge_orphaned_versions(db_session, scope="tasks") >= 1
+        assert not await get_collection_version(
+            db_session, scope="tasks", key=purged.id
+        )
+        assert await get_collection_version(db_session, scope="tasks", key=kept.id)
+        await purge_orphaned_versions(db_session, scope="projects")
+        assert await get_collection_version(
+            db_session, scope="projects", key=test_user.id
+        )
+
+    async def test_purge_deleted_keeps_recent_deletes(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test that rows deleted after the cutoff are kept for restoring."""
+        await crud_project.remove(db_session, id=test_project.id)
+
+        purged = await crud_project.purge_deleted(
+            db_session,
+            deleted_before=datetime.now(timezone.utc).replace(tzinfo=None)
+            - timedelta(days=1),
+        )
+
+        assert purged == 0
+        assert await crud_project.restore(db_session, id=test_project.id) is not None
+
+    async def test_task_counters(self, db_session: AsyncSession, test_user: User):
+        """Test that task counters follow task create, update, move and delete."""
+        project, other = await crud_project.create_many(
+            db_session,
+            objs_in=[
+                ProjectCreate(name="Counted", owner_id=test_user.id),
+                ProjectCreate(name="Other", owner_id=test_user.id),
+            ],
+        )
+        tasks = await crud_task.create_many(
+            db_session,
+            objs_in=[
+                TaskCreate(title="Todo", project_id=project.id),
+                TaskCreate(title="Doing", status="in_progress", project_id=project.id),
+                TaskCreate(title="Done", status="done", project_id=project.id),
+            ],
+        )
+        await db_session.refresh(project)
+        assert project.task_count == 3
+        assert project.todo_task_count == 1
+        assert project.in_progress_task_count == 1
+        assert project.done_task_count == 1
+
+        await crud_task.update(db_session, db_obj=tasks[0], obj_in={"status": "done"})
+        await crud_task.update(
+            db_session, db_obj=tasks[1], obj_in={"project_id": other.id}
+        )
+        await crud_task.remove(db_session, id=tasks[2].id)
+
+        await db_session.refresh(project)
+        await db_session.refresh(other)
+        assert (project.task_count, project.done_task_count) == (1, 1)
+        assert project.todo_task_count == project.in_progress_task_count == 0
+        assert (other.task_count, other.in_progress_task_count) == (1, 1)
+
+        await crud_task.restore(db_session, id=tasks[2].id)
+        await db_session.refresh(project)
+        assert (project.task_count, project.done_task_count) == (2, 2)
+
+    async def test_get_multi_filtered_reuses_cached_statement(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that calls with the same filter shape share one statement."""
+        await crud_project.create_many(
+            db_session,
+            objs_in=[
+                ProjectCreate(name="Active", status="active", owner_id=test_user.id),
+                ProjectCreate(
+                    name="Archived", status="archived", owner_id=test_user.id
+                ),
+            ],
+        )
+
+        active = await crud_project.get_multi_filtered(
+            db_session, owner_id=test_user.id, status="active"
+        )
+        statements = len(crud_project._statements)
+        archived = await crud_project.get_multi_filtered(
+            db_session, owner_id=test_user.id, status="archived"
+        )
+
+        assert len(crud_project._statements) == statements
+        assert [p.name for p in active] == ["Active"]
+        assert [p.name for p in archived] == ["Archived"]
+
+    async def test_statement_cache_evicts_least_recently_used(self):
+        """Test the statement cache stays bounded however many shapes are used."""
+        crud = CRUDProject(Project)
+        crud.statement_cache_size = 2
+        built: list[str] = []
+
+        def get(key: str) -> None:
+            def build() -> Select[Any]:
+                built.append(key)
+                return select(Project)
+
+            crud._get_statement(key, build)
+
+        get("a")
+        get("b")
+        get("a")  # now the most recently used
+        get("c")  # evicts "b"
+        get("a")
+        get("b")
+
+        assert built == ["a", "b", "c", "b"]
+        assert len(crud._statements) == 2
+
     async def test_get_multi_filtered_by_search(
         self, db_session: AsyncSession, test_user: User
     ):
@@ -326,3 +563,81 @@ class TestProjectCRUD:
         page1_ids = {p.id for p in page1}
         page2_ids = {p.id for p in page2}
         assert page1_ids.isdisjoint(page2_ids)
+
+    async def test_cursor_pagination(self, db_session: AsyncSession, test_user: User):
+        """Test keyset pagination with a non-unique sort column."""
+        for i in range(5):
+            await crud_project.create(
+                db_session,
+                obj_in=ProjectCreate(
+                    name=f"Project {i}", status="active", owner_id=test_user.id
+                ),
+            )
+
+        seen: list[Project] = []
+        cursor = None
+        while True:
+            page = await crud_project.get_multi_filtered(
+                db_session, limit=2, sort_by="status", sort_dir="asc", cursor=cursor
+            )
+            seen.extend(page)
+            cursor = crud_project.get_next_cursor(
+                page, has_more=len(page) == 2, sort_by="status", sort_dir="asc"
+            )
+            if cursor is None:
+                break
+
+        assert len(seen) == 5
+        assert len({p.id for p in seen}) == 5
+
+    async def test_cursor_sort_mismatch(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test that a cursor cannot be reused with a different sort order."""
+        cursor = crud_project.get_next_cursor(
+            [test_project], has_more=True, sort_by="name", sort_dir="asc"
+        )
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud_project.get_multi_filtered(
+                db_session, sort_by="name", sort_dir="desc", cursor=cursor
+            )
+
+        assert exc_info.value.status_code == 400
+
+    async def test_get_multi_filtered_by_relevance(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that name matches rank above description matches."""
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(
+                name="Roadmap", description="Mentions billing", owner_id=test_user.id
+            ),
+        )
+        await crud_project.create(
+            db_session,
+            obj_in=ProjectCreate(
+                name="Billing", description="Invoices", owner_id=test_user.id
+            ),
+        )
+
+        projects = await crud_project.get_multi_filtered(
+            db_session, search="billing", sort_by="relevance", sort_dir="desc"
+        )
+
+        assert [p.name for p in projects] == ["Billing", "Roadmap"]
+
+    async def test_update_bumps_updated_at(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test that updating a project sets a newer updated_at."""
+        previous = test_project.updated_at
+
+        updated_project = await crud_project.update(
+            db_session, db_obj=test_project, obj_in={"name": "Renamed"}
+        )
+
+        assert updated_project is test_project
+        assert updated_project.name == "Renamed"
+        assert updated_project.updated_at > previous
@@ -1,17 +1,37 @@
 """Unit tests for Task CRUD operations."""
 
+import json
 from datetime import date
+from typing import Any
 
 import pytest
 from fastapi import HTTPException
+from sqlalchemy import text
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from app.crud.project import project as crud_project
 from app.crud.task import task as crud_task
+from app.logic.utils.db_utils import Explain
 from app.models.project import Project
 from app.models.task import Task
 from app.schemas.task import TaskCreate, TaskUpdate
 
 
+def _index_conditions(plan: Any) -> list[str]:
+    """Every `Index Cond` in an `EXPLAIN (FORMAT JSON)` plan."""
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    if isinstance(plan, list):
+        return [c for node in plan for c in _index_conditions(node)]
+    if not isinstance(plan, dict):
+        return []
+    conditions = [plan["Index Cond"]] if "Index Cond" in plan else []
+    for value in plan.values():
+        if isinstance(value, (dict, list)):
+            conditions.extend(_index_conditions(value))
+    return conditions
+
+
 @pytest.mark.asyncio
 class TestTaskCRUD:
     """Test suite for Task CRUD operations."""
@@ -112,6 +132,17 @@ class TestTaskCRUD:
 
         assert updated_task.status == "done"
 
+    async def test_update_removed_task(self, db_session: AsyncSession, test_task: Task):
+        """Test updating a task removed after it was loaded."""
+        await crud_task.remove(db_session, id=test_task.id)
+
+        with pytest.raises(HTTPException) as exc_info:
+            await crud_task.update(
+                db_session, db_obj=test_task, obj_in=TaskUpdate(title="Too late")
+            )
+
+        assert exc_info.value.status_code == 404
+
     async def test_remove_task(self, db_session: AsyncSession, test_task: Task):
         """Test removing a task."""
         task_id = test_task.id
@@ -124,6 +155,20 @@ class TestTaskCRUD:
         task = await crud_task.get(db_session, id=task_id)
         assert task is None
 
+    async def test_get_multi_filtered_hides_tasks_of_deleted_project(
+        self,
+        db_session: AsyncSession,
+        test_project: Project,
+        multiple_test_tasks: list[Task],
+    ):
+        """Test that unscoped task lists skip the tasks of a removed project."""
+        await crud_project.remove(db_session, id=test_project.id)
+
+        tasks = await crud_task.get_multi_filtered(db_session, limit=100)
+
+        task_ids = {task.id for task in tasks}
+        assert not task_ids & {task.id for task in multiple_test_tasks}
+
     async def test_get_multi_filtered_by_search(
         self, db_session: AsyncSession, test_project: Project
     ):
@@ -350,6 +395,28 @@ class TestTaskCRUD:
         page2_ids = {t.id for t in page2}
         assert page1_ids.isdisjoint(page2_ids)
 
+    async def test_get_multi_filtered_as_rows(
+        self, db_session: AsyncSession, multiple_test_tasks: list[Task]
+    ):
+        """Test row mode returns the same page as plain rows outside the session."""
+        project_id = multiple_test_tasks[0].project_id
+        tasks = await crud_task.get_multi_filtered(db_session, project_id=project_id)
+        db_session.expunge_all()
+
+        rows = await crud_task.get_multi_filtered(
+            db_session, project_id=project_id, rows=True
+        )
+
+        assert [r.id for r in rows] == [t.id for t in tasks]
+        assert [r.title for r in rows] == [t.title for t in tasks]
+        assert "search_vector" not in rows[0]._fields
+        assert len(db_session.identity_map) == 0
+
+        sparse = await crud_task.get_multi_filtered(
+            db_session, project_id=project_id, fields={"title"}, rows=True
+        )
+        assert sparse[0]._fields == ("created_at", "id", "title")
+
     async def test_task_with_due_date(
         self, db_session: AsyncSession, test_project: Project
     ):
@@ -372,3 +439,99 @@ class TestTaskCRUD:
         )
 
         assert updated_task.due_date == new_due
+
+    async def test_cursor_pagination_with_null_sort_values(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test keyset pagination over a nullable sort column."""
+        for i in range(4):
+            await crud_task.create(
+                db_session,
+                obj_in=TaskCreate(
+                    project_id=test_project.id,
+                    title=f"Task {i}",
+                    due_date=date(2027, 1, i + 1) if i % 2 else None,
+                ),
+            )
+
+        for sort_dir in ("asc", "desc"):
+            seen: list[Task] = []
+            cursor = None
+            while True:
+                page = await crud_task.get_multi_filtered(
+                    db_session,
+                    limit=1,
+                    project_id=test_project.id,
+                    sort_by="due_date",
+                    sort_dir=sort_dir,
+                    cursor=cursor,
+                )
+                seen.extend(page)
+                cursor = crud_task.get_next_cursor(
+                    page, has_more=len(page) == 1, sort_by="due_date", sort_dir=sort_dir
+                )
+                if cursor is None:
+                    break
+
+            assert len({t.id for t in seen}) == 4
+
+    async def test_cursor_seek_is_an_index_condition(
+        self, db_session: AsyncSession, multiple_test_tasks: list[Task]
+    ):
+        """Test the seek on a NOT NULL sort column bounds the index scan."""
+        project_id = multiple_test_tasks[0].project_id
+        page = await crud_task.get_multi_filtered(
+            db_session, project_id=project_id, limit=2
+        )
+        cursor = crud_task.get_next_cursor(
+            page, has_more=True, sort_by="created_at", sort_dir="desc"
+        )
+        assert cursor is not None
+        params: dict[str, Any] = {
+            "project_id": project_id,
+            "limit": 2,
+            **crud_task.get_cursor_params(
+                cursor, sort_by="created_at", sort_dir="desc"
+            ),
+        }
+        query = crud_task._build_multi_filtered(
+            frozenset(params), sort_by="created_at", sort_dir="desc"
+        )
+
+        # The test tables are tiny, keep the planner from scanning them instead
+        await db_session.execute(text("SET LOCAL enable_seqscan = off"))
+        plan = (await db_session.execute(Explain(query), params)).scalar()
+
+        conditions = _index_conditions(plan)
+        assert any("ROW(created_at, id) <" in c for c in conditions), conditions
+
+    async def test_iterate_yields_each_task_once(
+        self, db_session: AsyncSession, multiple_test_tasks: list[Task]
+    ):
+        """Test iterating in batches visits every task once and detaches it."""
+        seen: list[Task] = []
+        async for task in crud_task.iterate(db_session, n=2):
+            seen.append(task)
+
+        assert {t.id for t in seen} == {t.id for t in multiple_test_tasks}
+        assert len(seen) == len(multiple_test_tasks)
+        assert [t.id for t in seen] == sorted(t.id for t in seen)
+        assert all(t not in db_session for t in seen)
+
+    async def test_create_many_tasks(
+        self, db_session: AsyncSession, test_project: Project
+    ):
+        """Test creating several tasks with one INSERT."""
+        tasks_in = [
+            TaskCreate(project_id=test_project.id, title=f"Bulk {i}", priority=i + 1)
+            for i in range(3)
+        ]
+        tasks = await crud_task.create_many(db_session, objs_in=tasks_in)
+
+        assert [t.title for t in tasks] == ["Bulk 0", "Bulk 1", "Bulk 2"]
+        assert all(t.id is not None and t.created_at is not None for t in tasks)
+
+        persisted = await crud_task.get_count_filtered(
+            db_session, project_id=test_project.id
+        )
+        assert persisted == 3
@@ -31,6 +31,22 @@ class TestUserCRUD:
         assert user.is_active is True
         assert user.id is not None
 
+    async def test_roles_round_trip_through_jsonb(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test roles are encoded and decoded by the connection's JSONB codecs."""
+        await crud_user.update(
+            db_session, db_obj=test_user, obj_in=UserUpdate(roles=["admin", "ünïcode"])
+        )
+        db_session.expunge_all()
+
+        user = await crud_user.get_by_auth0_sub(
+            db_session, auth0_sub=test_user.auth0_sub
+        )
+
+        assert user is not None
+        assert user.roles == ["admin", "ünïcode"]
+
     async def test_get_user(self, db_session: AsyncSession, test_user: User):
         """Test getting a user by ID."""
         user = await crud_user.get(db_session, id=test_user.id)
@@ -79,6 +95,29 @@ class TestUserCRUD:
 
         assert user is None
 
+    async def test_get_or_create_by_auth0_sub_creates(self, db_session: AsyncSession):
+        """Test that an unknown auth0_sub is inserted."""
+        user, created = await crud_user.get_or_create_by_auth0_sub(
+            db_session, obj_in=UserCreate(auth0_sub="auth0|upsert1", name="Upsert")
+        )
+
+        assert created is True
+        assert user.auth0_sub == "auth0|upsert1"
+        assert user.name == "Upsert"
+
+    async def test_get_or_create_by_auth0_sub_existing(
+        self, db_session: AsyncSession, test_user: User
+    ):
+        """Test that a known auth0_sub returns the existing user unchanged."""
+        user, created = await crud_user.get_or_create_by_auth0_sub(
+            db_session,
+            obj_in=UserCreate(auth0_sub=test_user.auth0_sub, name="Other Name"),
+        )
+
+        assert created is False
+        assert user.id == test_user.id
+        assert user.name == test_user.name
+
     async def test_get_user_by_email(self, db_session: AsyncSession, test_user: User):
         """Test getting a user by email."""
         user = await crud_user.get_by_email(db_session, email=test_user.email)
@@ -30,6 +30,7 @@ async def app(
         return test_admin_user
 
     fastapi_app.dependency_overrides[deps_module.get_db] = override_get_db
+    fastapi_app.dependency_overrides[deps_module.get_read_db] = override_get_db
     fastapi_app.dependency_overrides[
         deps_module.CurrentUser.__metadata__[0].dependency
     ] = override_current_user
@@ -10,6 +10,7 @@ from sqlalchemy import event, text
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
 from app.core.config import settings
+from app.core.db import _create_engine
 
 # Use separate test database
 TEST_DB_NAME = "app_test"
@@ -94,7 +95,8 @@ async def test_engine(test_db_setup: None):
     test_db_url = str(settings.SQLALCHEMY_DATABASE_URI).replace(
         f"/{settings.POSTGRES_DB}", f"/{TEST_DB_NAME}"
     )
-    engine = create_async_engine(test_db_url, echo=False)
+    # Same connection setup (pool, codecs, server settings) as the app engine
+    engine = _create_engine(test_db_url)
 
     print(f"Created test database engine with URL: {test_db_setup}")
 
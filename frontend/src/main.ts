@@ -13,6 +13,7 @@ import router from './router'
 client.setConfig({
   baseURL: import.meta.env.VITE_API_URL,
   throwOnError: true, // Always throw errors instead of returning them
+  withCredentials: true, // Sends the API's read-your-writes cookie
 })
 
 const app = createApp(App)